@@ -0,0 +1,125 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+
+# [START securitycenter_v1beta_modelarmor_templates_get_async]
+import asyncio
+import logging
+
+from google.api_core.client_options import ClientOptions
+from google.api_core import exceptions
+from google.cloud import modelarmor_v1beta as modelarmor
+
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def get_model_armor_templates(
+    project_id: str,
+    location: str,
+    template_ids: list[str],
+) -> None:
+    """
+    Retrieves the details of several Model Armor templates concurrently.
+
+    This sample demonstrates how to use the asynchronous client to issue
+    multiple requests at once instead of waiting for each one in turn.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        location: The Google Cloud location (e.g., "us-central1").
+        template_ids: The IDs of the templates to retrieve.
+    """
+    # Create the async client, pointing to the location's API endpoint.
+    # Unlike the synchronous samples, which use the REST transport, the async
+    # client only supports gRPC, so it talks to the same endpoint over gRPC.
+    client = modelarmor.ModelArmorAsyncClient(
+        client_options=ClientOptions(
+            api_endpoint=f"modelarmor.{location}.rep.googleapis.com"
+        ),
+    )
+
+    template_names = [
+        client.template_path(
+            project=project_id, location=location, template=template_id
+        )
+        for template_id in template_ids
+    ]
+
+    try:
+        # Send all requests at once. They share the client's connection, so the
+        # total wait is close to that of the slowest single request.
+        # return_exceptions=True keeps one failed lookup from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(client.get_template(name=name) for name in template_names),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for template_name, result in zip(template_names, results):
+        if isinstance(result, exceptions.NotFound):
+            logger.error("Error: Template '%s' not found.", template_name)
+        elif isinstance(result, exceptions.GoogleAPICallError):
+            logger.error("Failed to retrieve template '%s': %s", template_name, result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            logger.info("Successfully retrieved template: %s", result.name)
+            logger.info("  Create time: %s", result.create_time.rfc3339())
+            logger.info("  Update time: %s", result.update_time.rfc3339())
+
+
+# [END securitycenter_v1beta_modelarmor_templates_get_async]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Retrieve several Model Armor templates concurrently."
+    )
+    parser.add_argument(
+        "--project_id",
+        required=True,
+        type=str,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--location",
+        required=True,
+        type=str,
+        help="The Google Cloud location (e.g., 'us-central1').",
+    )
+    parser.add_argument(
+        "--template_ids",
+        required=True,
+        nargs="+",
+        type=str,
+        help="The IDs of the templates to retrieve.",
+    )
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    asyncio.run(
+        get_model_armor_templates(
+            project_id=args.project_id,
+            location=args.location,
+            template_ids=args.template_ids,
+        )
+    )
@@ -0,0 +1,178 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs any of the Model Armor samples in this directory from one entry point.
+
+Each sample file stays self-contained so it can be embedded in the
+documentation. This module only dispatches to them, which lets a test harness
+exercise every sample from a single Python process instead of starting one
+interpreter (and loading the client library) per sample.
+
+Example:
+    python model_armor_cli.py floor-setting get --project_id my-project
+    python model_armor_cli.py template list --project_id my-project \\
+        --location us-central1
+"""
+
+import argparse
+import asyncio
+import logging
+
+from model_armor_async_client_templates_get import get_model_armor_templates
+from model_armor_client_floor_setting_get import get_floor_setting
+from model_armor_client_floor_setting_update import update_floor_setting
+from model_armor_client_template_create import create_template
+from model_armor_client_template_delete import delete_template
+from model_armor_client_template_get import get_model_armor_template
+from model_armor_client_template_update import update_template
+from model_armor_client_templates_list import list_templates
+
+
+def _add_project_id(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--project_id",
+        required=True,
+        type=str,
+        help="The Google Cloud project ID.",
+    )
+
+
+def _add_location(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--location",
+        required=True,
+        type=str,
+        help="The Google Cloud location (e.g., 'us-central1').",
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run a Model Armor sample.")
+    resources = parser.add_subparsers(dest="resource", required=True)
+
+    floor_setting = resources.add_parser("floor-setting", help="Floor setting samples.")
+    floor_setting_commands = floor_setting.add_subparsers(dest="command", required=True)
+
+    get_floor_setting_parser = floor_setting_commands.add_parser(
+        "get", help="Retrieve the project's floor setting."
+    )
+    _add_project_id(get_floor_setting_parser)
+    get_floor_setting_parser.set_defaults(
+        run=lambda args: get_floor_setting(args.project_id)
+    )
+
+    update_floor_setting_parser = floor_setting_commands.add_parser(
+        "update", help="Update the project's floor setting."
+    )
+    _add_project_id(update_floor_setting_parser)
+    update_floor_setting_parser.set_defaults(
+        run=lambda args: update_floor_setting(args.project_id)
+    )
+
+    template = resources.add_parser("template", help="Template samples.")
+    template_commands = template.add_subparsers(dest="command", required=True)
+
+    create_parser = template_commands.add_parser("create", help="Create a template.")
+    _add_project_id(create_parser)
+    _add_location(create_parser)
+    create_parser.add_argument(
+        "--template_id",
+        required=True,
+        type=str,
+        help="The ID to assign to the new template.",
+    )
+    create_parser.set_defaults(
+        run=lambda args: create_template(
+            args.project_id, args.location, args.template_id
+        )
+    )
+
+    delete_parser = template_commands.add_parser("delete", help="Delete a template.")
+    _add_project_id(delete_parser)
+    _add_location(delete_parser)
+    delete_parser.add_argument(
+        "--template_id",
+        required=True,
+        type=str,
+        help="The ID of the template to delete.",
+    )
+    delete_parser.set_defaults(
+        run=lambda args: delete_template(
+            args.project_id, args.location, args.template_id
+        )
+    )
+
+    get_parser = template_commands.add_parser("get", help="Retrieve templates.")
+    _add_project_id(get_parser)
+    _add_location(get_parser)
+    get_parser.add_argument(
+        "--template_ids",
+        required=True,
+        nargs="+",
+        type=str,
+        help="The IDs of the templates to retrieve. More than one ID fetches "
+        "them concurrently with the async client.",
+    )
+    get_parser.set_defaults(run=_get_templates)
+
+    update_parser = template_commands.add_parser("update", help="Update a template.")
+    _add_project_id(update_parser)
+    _add_location(update_parser)
+    update_parser.add_argument(
+        "--template_id",
+        required=True,
+        type=str,
+        help="The ID of the template to update.",
+    )
+    update_parser.add_argument(
+        "--new_enforcement_type",
+        type=str,
+        default="INSPECT_ONLY",
+        choices=["INSPECT_ONLY", "INSPECT_AND_BLOCK"],
+        help="The new enforcement type for the template's metadata.",
+    )
+    update_parser.set_defaults(
+        run=lambda args: update_template(
+            args.project_id,
+            args.location,
+            args.template_id,
+            args.new_enforcement_type,
+        )
+    )
+
+    list_parser = template_commands.add_parser("list", help="List templates.")
+    _add_project_id(list_parser)
+    _add_location(list_parser)
+    list_parser.set_defaults(
+        run=lambda args: list_templates(args.project_id, args.location)
+    )
+
+    return parser
+
+
+def _get_templates(args: argparse.Namespace) -> None:
+    if len(args.template_ids) == 1:
+        get_model_armor_template(args.project_id, args.location, args.template_ids[0])
+    else:
+        asyncio.run(
+            get_model_armor_templates(args.project_id, args.location, args.template_ids)
+        )
+
+
+if __name__ == "__main__":
+    args = _build_parser().parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    args.run(args)
@@ -15,11 +15,16 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_floorsetting_get]
-import sys
+import logging
 
 from google.api_core import exceptions
 from google.cloud import modelarmor_v1beta as modelarmor
 
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def get_floor_setting(project_id: str) -> None:
     """
@@ -42,37 +47,34 @@ def get_floor_setting(project_id: str) -> None:
     try:
         floor_setting = client.get_floor_setting(name=floor_setting_name)
 
-        print(f"Successfully retrieved floor setting: {floor_setting.name}")
-        print(f"  Create Time: {floor_setting.create_time.isoformat()}")
-        print(f"  Update Time: {floor_setting.update_time.isoformat()}")
-        print(
-            f"  Enforcement Enabled: {floor_setting.enable_floor_setting_enforcement}"
+        logger.info("Successfully retrieved floor setting: %s", floor_setting.name)
+        logger.info("  Create Time: %s", floor_setting.create_time.rfc3339())
+        logger.info("  Update Time: %s", floor_setting.update_time.rfc3339())
+        logger.info(
+            "  Enforcement Enabled: %s", floor_setting.enable_floor_setting_enforcement
         )
-        print(
-            f"  Integrated Services: {', '.join(str(s.name) for s in floor_setting.integrated_services)}"
+        logger.info(
+            "  Integrated Services: %s",
+            ", ".join(s.name for s in floor_setting.integrated_services),
         )
         if floor_setting.filter_config:
-            print(f"  Filter Config Present: True")
+            logger.info("  Filter Config Present: True")
             if floor_setting.filter_config.rai_settings:
-                print(f"    RAI Filters:")
+                logger.info("    RAI Filters:")
                 for rai_filter in floor_setting.filter_config.rai_settings.rai_filters:
-                    print(
-                        f"      - Type: {rai_filter.filter_type.name}, Confidence: {rai_filter.confidence_level.name}"
+                    logger.info(
+                        "      - Type: %s, Confidence: %s",
+                        rai_filter.filter_type.name,
+                        rai_filter.confidence_level.name,
                     )
 
     except exceptions.NotFound:
-        print(
-            f"Error: Floor setting '{floor_setting_name}' not found.", file=sys.stderr
-        )
-        print(
-            "Please ensure the project ID and location are correct and a floor setting exists.",
-            file=sys.stderr,
-        )
-    except Exception as e:
-        print(
-            f"Failed to retrieve floor setting due to an unexpected error: {e}",
-            file=sys.stderr,
+        logger.error("Error: Floor setting '%s' not found.", floor_setting_name)
+        logger.error(
+            "Please ensure the project ID and location are correct and a floor setting exists."
         )
+    except exceptions.GoogleAPICallError as e:
+        logger.error("Failed to retrieve floor setting due to an API error: %s", e)
 
 
 # [END securitycenter_v1beta_modelarmor_floorsetting_get]
@@ -89,4 +91,6 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     get_floor_setting(args.project_id)
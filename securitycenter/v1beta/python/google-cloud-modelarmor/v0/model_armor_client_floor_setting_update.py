@@ -15,10 +15,36 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_floorsetting_update]
-from google.api_core.exceptions import NotFound
+import logging
+
+from google.api_core.exceptions import GoogleAPICallError, NotFound
 from google.cloud import modelarmor_v1beta as modelarmor
 from google.protobuf import field_mask_pb2
 
+# Define the updated Responsible AI (RAI) filter settings.
+# For this example, we'll enable SEXUALLY_EXPLICIT and HATE_SPEECH filters
+# with HIGH confidence levels. The settings don't depend on the project, so
+# they are built once and copied into each FloorSetting.
+RAI_FILTER_CONFIG = modelarmor.FilterConfig(
+    rai_settings=modelarmor.RaiFilterSettings(
+        rai_filters=[
+            modelarmor.RaiFilterSettings.RaiFilter(
+                filter_type=modelarmor.RaiFilterType.SEXUALLY_EXPLICIT,
+                confidence_level=modelarmor.DetectionConfidenceLevel.HIGH,
+            ),
+            modelarmor.RaiFilterSettings.RaiFilter(
+                filter_type=modelarmor.RaiFilterType.HATE_SPEECH,
+                confidence_level=modelarmor.DetectionConfidenceLevel.HIGH,
+            ),
+        ]
+    )
+)
+
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def update_floor_setting(
     project_id: str,
@@ -42,20 +68,6 @@ def update_floor_setting(
         project=project_id, location="global"
     )
 
-    # Define the updated Responsible AI (RAI) filter settings.
-    # For this example, we'll enable SEXUALLY_EXPLICIT and HATE_SPEECH filters
-    # with HIGH confidence levels.
-    rai_filters = [
-        modelarmor.RaiFilterSettings.RaiFilter(
-            filter_type=modelarmor.RaiFilterType.SEXUALLY_EXPLICIT,
-            confidence_level=modelarmor.DetectionConfidenceLevel.HIGH,
-        ),
-        modelarmor.RaiFilterSettings.RaiFilter(
-            filter_type=modelarmor.RaiFilterType.HATE_SPEECH,
-            confidence_level=modelarmor.DetectionConfidenceLevel.HIGH,
-        ),
-    ]
-
     # Construct the FloorSetting object with the fields to be updated.
     # The 'name' field is required to identify the resource.
     floor_setting = modelarmor.FloorSetting(
@@ -64,9 +76,7 @@ def update_floor_setting(
         # A filter_config is required for a valid FloorSetting. If you are
         # only updating other fields, ensure you include the existing filter_config
         # or provide a new one.
-        filter_config=modelarmor.FilterConfig(
-            rai_settings=modelarmor.RaiFilterSettings(rai_filters=rai_filters)
-        ),
+        filter_config=RAI_FILTER_CONFIG,
     )
 
     # Create a FieldMask to specify which fields of the FloorSetting are being updated.
@@ -83,20 +93,24 @@ def update_floor_setting(
             floor_setting=floor_setting, update_mask=update_mask
         )
 
-        print(f"Updated FloorSetting: {operation.name}")
-        print(
-            f"  RAI Filters enabled: {operation.filter_config.rai_settings.rai_filters}"
+        logger.info("Updated FloorSetting: %s", operation.name)
+        logger.info(
+            "  RAI Filters enabled: %s",
+            operation.filter_config.rai_settings.rai_filters,
         )
-        print(f"  Enforcement enabled: {operation.enable_floor_setting_enforcement}")
-        print(f"  Updated at: {operation.update_time.isoformat()}")
+        logger.info(
+            "  Enforcement enabled: %s", operation.enable_floor_setting_enforcement
+        )
+        logger.info("  Updated at: %s", operation.update_time.rfc3339())
 
     except NotFound:
-        print(
-            f"Error: Floor setting '{floor_setting_name}' not found. "
-            "Please ensure the project and location are correct and that a floor setting exists."
+        logger.error(
+            "Error: Floor setting '%s' not found. "
+            "Please ensure the project and location are correct and that a floor setting exists.",
+            floor_setting_name,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    except GoogleAPICallError as e:
+        logger.error("An API error occurred: %s", e)
 
 
 # [END securitycenter_v1beta_modelarmor_floorsetting_update]
@@ -113,4 +127,6 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     update_floor_setting(args.project_id)
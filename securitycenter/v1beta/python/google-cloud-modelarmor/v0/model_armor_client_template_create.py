@@ -15,10 +15,17 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_template_create]
+import logging
+
 from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import AlreadyExists, GoogleAPICallError
 from google.cloud import modelarmor_v1beta as modelarmor
 
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def create_template(
     project_id: str,
@@ -69,18 +76,19 @@ def create_template(
 
         response = client.create_template(request=request)
 
-        print(f"Successfully created template: {response.name}")
-        print(f"Created at: {response.create_time.isoformat()}")
+        logger.info("Successfully created template: %s", response.name)
+        logger.info("Created at: %s", response.create_time.rfc3339())
 
     except AlreadyExists as e:
-        print(
-            f"Error: Template '{template_id}' already exists in '{parent}'. "
-            f"Please choose a different template ID or use update_template. Details: {e}"
+        logger.error(
+            "Error: Template '%s' already exists in '%s'. "
+            "Please choose a different template ID or use update_template. Details: %s",
+            template_id,
+            parent,
+            e,
         )
     except GoogleAPICallError as e:
-        print(f"An API error occurred: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("An API error occurred: %s", e)
 
 
 # [END securitycenter_v1beta_modelarmor_template_create]
@@ -107,4 +115,6 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     create_template(args.project_id, args.location, args.template_id)
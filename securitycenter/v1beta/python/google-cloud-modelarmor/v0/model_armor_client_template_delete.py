@@ -15,10 +15,17 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_template_delete]
+import logging
+
 from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import GoogleAPICallError, NotFound
 from google.cloud import modelarmor_v1beta as modelarmor
 
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def delete_template(project_id: str, location: str, template_id: str) -> None:
     """Deletes a Model Armor template.
@@ -42,13 +49,11 @@ def delete_template(project_id: str, location: str, template_id: str) -> None:
 
     try:
         client.delete_template(name=template_name)
-        print(f"Successfully deleted template: {template_name}")
+        logger.info("Successfully deleted template: %s", template_name)
     except NotFound:
-        print(f"Template '{template_name}' not found.")
+        logger.error("Template '%s' not found.", template_name)
     except GoogleAPICallError as e:
-        print(f"Error deleting template '{template_name}': {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("Error deleting template '%s': %s", template_name, e)
 
 
 # [END securitycenter_v1beta_modelarmor_template_delete]
@@ -72,6 +77,8 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     delete_template(
         project_id=args.project_id,
         location=args.location,
@@ -15,10 +15,17 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_template_get]
+import logging
+
 from google.api_core.client_options import ClientOptions
 from google.api_core import exceptions
 from google.cloud import modelarmor_v1beta as modelarmor
 
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def get_model_armor_template(
     project_id: str,
@@ -48,18 +55,20 @@ def get_model_armor_template(
     try:
         template = client.get_template(name=template_name)
 
-        print(f"Successfully retrieved template: {template.name}")
-        print(f"  Create time: {template.create_time.isoformat()}")
-        print(f"  Update time: {template.update_time.isoformat()}")
-        print(f"  Filter config: {template.filter_config}")
+        logger.info("Successfully retrieved template: %s", template.name)
+        logger.info("  Create time: %s", template.create_time.rfc3339())
+        logger.info("  Update time: %s", template.update_time.rfc3339())
+        logger.info("  Filter config: %s", template.filter_config)
         if template.labels:
-            print(f"  Labels: {template.labels}")
+            logger.info("  Labels: %s", template.labels)
 
     except exceptions.NotFound:
-        print(f"Error: Template '{template_name}' not found.")
-        print("Please ensure the project ID, location, and template ID are correct.")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("Error: Template '%s' not found.", template_name)
+        logger.error(
+            "Please ensure the project ID, location, and template ID are correct."
+        )
+    except exceptions.GoogleAPICallError as e:
+        logger.error("An API error occurred: %s", e)
 
 
 # [END securitycenter_v1beta_modelarmor_template_get]
@@ -90,6 +99,8 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     get_model_armor_template(
         project_id=args.project_id,
         location=args.location,
@@ -15,11 +15,18 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_template_update]
+import logging
+
 from google.api_core.client_options import ClientOptions
 from google.api_core import exceptions
 from google.cloud import modelarmor_v1beta as modelarmor
 from google.protobuf import field_mask_pb2
 
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def update_template(
     project_id: str,
@@ -59,9 +66,10 @@ def update_template(
             ]
         )
     except KeyError:
-        print(
-            f"Error: Invalid enforcement type '{new_enforcement_type}'. "
-            "Valid options are 'INSPECT_ONLY' and 'INSPECT_AND_BLOCK'."
+        logger.error(
+            "Error: Invalid enforcement type '%s'. "
+            "Valid options are 'INSPECT_ONLY' and 'INSPECT_AND_BLOCK'.",
+            new_enforcement_type,
         )
         return
 
@@ -87,19 +95,21 @@ def update_template(
     try:
         response = client.update_template(request=request)
 
-        print(f"Template '{response.name}' updated successfully.")
-        print(
-            f"New enforcement type: {response.template_metadata.enforcement_type.name}"
+        logger.info("Template '%s' updated successfully.", response.name)
+        logger.info(
+            "New enforcement type: %s",
+            response.template_metadata.enforcement_type.name,
         )
 
     except exceptions.NotFound as e:
-        print(
-            f"Error: Template '{template_name}' not found. Please ensure the template exists."
+        logger.error(
+            "Error: Template '%s' not found. Please ensure the template exists.",
+            template_name,
         )
-        print(f"Details: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        print("Please check your project ID, location, and template ID.")
+        logger.error("Details: %s", e)
+    except exceptions.GoogleAPICallError as e:
+        logger.error("An API error occurred: %s", e)
+        logger.error("Please check your project ID, location, and template ID.")
 
 
 # [END securitycenter_v1beta_modelarmor_template_update]
@@ -136,6 +146,8 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     update_template(
         project_id=args.project_id,
         location=args.location,
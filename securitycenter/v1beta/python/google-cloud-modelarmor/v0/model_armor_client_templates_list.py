@@ -15,12 +15,17 @@
 import argparse
 
 # [START securitycenter_v1beta_modelarmor_templates_list]
-import sys
+import logging
 
 from google.api_core.client_options import ClientOptions
 from google.api_core import exceptions
 from google.cloud import modelarmor_v1beta as modelarmor
 
+# The sample reports its results through this logger, which shows nothing
+# until the caller configures a handler, for example:
+#     logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 
 def list_templates(project_id: str, location: str) -> None:
     """Lists templates in a given project and location.
@@ -45,23 +50,23 @@ def list_templates(project_id: str, location: str) -> None:
 
         page_result = client.list_templates(request=request)
 
-        print(f"Listing templates for parent: {parent}")
+        logger.info("Listing templates for parent: %s", parent)
         found_templates = False
         for response in page_result:
-            print(f"Template found: {response.name}")
+            logger.info("Template found: %s", response.name)
             found_templates = True
 
         if not found_templates:
-            print(f"No templates found in {parent}.")
+            logger.info("No templates found in %s.", parent)
 
     except exceptions.NotFound:
-        print(
-            f"Error: The specified project or location '{parent}' was not found. "
+        logger.error(
+            "Error: The specified project or location '%s' was not found. "
             "Please ensure the project ID and location are correct.",
-            file=sys.stderr,
+            parent,
         )
     except exceptions.GoogleAPICallError as e:
-        print(f"An API error occurred: {e}", file=sys.stderr)
+        logger.error("An API error occurred: %s", e)
 
 
 # [END securitycenter_v1beta_modelarmor_templates_list]
@@ -84,4 +89,6 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     list_templates(args.project_id, args.location)
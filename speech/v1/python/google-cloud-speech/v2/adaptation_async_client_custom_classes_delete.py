@@ -0,0 +1,166 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v1_adaptation_customclasses_delete_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1
+
+# Deletes are sent in batches of up to MAX_BATCH_SIZE requests, with at most
+# MAX_CONCURRENT_BATCHES batches in flight at once. Bounding the number of
+# concurrent requests keeps a large cleanup from exhausting the connection's
+# stream limit or tripping server-side rate limits.
+MAX_BATCH_SIZE = 32
+MAX_CONCURRENT_BATCHES = 4
+
+
+async def delete_custom_class_async(
+    client: speech_v1.AdaptationAsyncClient,
+    name: str,
+) -> None:
+    """Deletes a single custom class using the asynchronous client.
+
+    Args:
+        client: The AdaptationAsyncClient to send the request with.
+        name: The full resource name of the custom class to delete.
+    """
+    await client.delete_custom_class(name=name)
+
+
+async def _delete_batch(
+    client: speech_v1.AdaptationAsyncClient,
+    names: list[str],
+    semaphore: asyncio.Semaphore,
+) -> list:
+    """Deletes one batch of custom classes once a batch slot is free."""
+    async with semaphore:
+        # return_exceptions=True keeps one failed delete from cancelling the rest.
+        return await asyncio.gather(
+            *(delete_custom_class_async(client, name) for name in names),
+            return_exceptions=True,
+        )
+
+
+async def delete_custom_classes(
+    project_id: str,
+    custom_class_ids: list[str],
+) -> None:
+    """Deletes several custom classes concurrently.
+
+    The requests share one client, so they are multiplexed over a single
+    connection and their round trips overlap instead of running back to back.
+    They are grouped into batches so only a bounded number run at once.
+    IDs that don't exist are skipped without sending a delete request.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        custom_class_ids: The IDs of the custom classes to delete.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1
+
+    client = speech_v1.AdaptationAsyncClient()
+
+    names = [
+        client.custom_class_path(
+            project_id, location="global", custom_class=custom_class_id
+        )
+        for custom_class_id in custom_class_ids
+    ]
+
+    try:
+        # List the existing custom classes once and only send deletes for
+        # those that exist, so missing IDs cost neither a round trip nor an
+        # exception.
+        pager = await client.list_custom_classes(
+            request={
+                "parent": client.common_location_path(project_id, "global"),
+                "page_size": 1000,
+            }
+        )
+        # Compare by the trailing ID, since the service may return names that
+        # use the project number rather than the project ID.
+        existing = {
+            custom_class.name.rsplit("/", 1)[-1] async for custom_class in pager
+        }
+        for name in names:
+            if name.rsplit("/", 1)[-1] not in existing:
+                print(
+                    f"Custom class '{name}' not found. It may have already "
+                    "been deleted.",
+                    file=sys.stderr,
+                )
+        names = [name for name in names if name.rsplit("/", 1)[-1] in existing]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+        batches = [
+            names[start : start + MAX_BATCH_SIZE]
+            for start in range(0, len(names), MAX_BATCH_SIZE)
+        ]
+        batch_results = await asyncio.gather(
+            *(_delete_batch(client, batch, semaphore) for batch in batches)
+        )
+        results = [result for batch in batch_results for result in batch]
+    finally:
+        await client.transport.close()
+
+    for name, result in zip(names, results):
+        if isinstance(result, exceptions.NotFound):
+            print(
+                f"Custom class '{name}' not found. It may have already been deleted.",
+                file=sys.stderr,
+            )
+        elif isinstance(result, exceptions.GoogleAPICallError):
+            print(f"Failed to delete custom class '{name}': {result}", file=sys.stderr)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Successfully deleted custom class: {name}")
+
+
+# [END speech_v1_adaptation_customclasses_delete_async]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Deletes several custom classes for Speech-to-Text adaptation."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--custom_class_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="A comma-separated list of custom class IDs to delete (e.g., 'a,b,c').",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        delete_custom_classes(
+            project_id=args.project_id, custom_class_ids=args.custom_class_ids
+        )
+    )
@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v1_adaptation_phrasesets_delete_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1
+
+# The maximum number of delete requests in flight at once. Bounding this keeps
+# a large cleanup from exhausting the connection's stream limit or tripping
+# server-side rate limits.
+MAX_CONCURRENT_DELETES = 16
+
+
+async def _delete_phrase_set(
+    client: speech_v1.AdaptationAsyncClient,
+    name: str,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Deletes one phrase set once a request slot is free."""
+    async with semaphore:
+        await client.delete_phrase_set(name=name)
+
+
+async def delete_phrase_sets(
+    project_id: str,
+    phrase_set_ids: list[str],
+) -> None:
+    """Deletes several phrase sets concurrently.
+
+    The requests share one client, so they are multiplexed over a single
+    connection and their round trips overlap instead of running back to back.
+    IDs that don't exist are skipped without sending a delete request.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_ids: The IDs of the phrase sets to delete.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1
+
+    client = speech_v1.AdaptationAsyncClient()
+
+    names = [
+        client.phrase_set_path(project_id, location="global", phrase_set=phrase_set_id)
+        for phrase_set_id in phrase_set_ids
+    ]
+
+    try:
+        # List the existing phrase sets once and only send deletes for those
+        # that exist, so missing IDs cost neither a round trip nor an
+        # exception.
+        pager = await client.list_phrase_set(
+            request={
+                "parent": client.common_location_path(project_id, "global"),
+                "page_size": 1000,
+            }
+        )
+        # Compare by the trailing ID, since the service may return names that
+        # use the project number rather than the project ID.
+        existing = {phrase_set.name.rsplit("/", 1)[-1] async for phrase_set in pager}
+        for name in names:
+            if name.rsplit("/", 1)[-1] not in existing:
+                print(
+                    f"Phrase set '{name}' not found. It may have already been "
+                    "deleted.",
+                    file=sys.stderr,
+                )
+        names = [name for name in names if name.rsplit("/", 1)[-1] in existing]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+        # return_exceptions=True keeps one failed delete from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(_delete_phrase_set(client, name, semaphore) for name in names),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for name, result in zip(names, results):
+        if isinstance(result, exceptions.NotFound):
+            print(
+                f"Phrase set '{name}' not found. It may have already been deleted.",
+                file=sys.stderr,
+            )
+        elif isinstance(result, exceptions.GoogleAPICallError):
+            print(f"Failed to delete phrase set '{name}': {result}", file=sys.stderr)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Phrase set {name} deleted successfully.")
+
+
+# [END speech_v1_adaptation_phrasesets_delete_async]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Deletes several phrase sets in Google Cloud Speech-to-Text."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--phrase_set_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="A comma-separated list of phrase set IDs to delete (e.g., 'a,b,c').",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        delete_phrase_sets(
+            project_id=args.project_id, phrase_set_ids=args.phrase_set_ids
+        )
+    )
@@ -15,11 +15,23 @@
 import argparse
 
 # [START speech_v1_adaptation_customclass_create]
+import atexit
+import functools
 import sys
 
-
 from google.api_core.exceptions import AlreadyExists, GoogleAPICallError, NotFound
-from google.cloud import speech_v1 as speech
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1 as speech
+
+    client = speech.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def create_custom_class(
@@ -37,16 +49,17 @@ def create_custom_class(
         custom_class_id: The ID to use for the custom class. This will be the final
                          component of the custom class's resource name.
     """
-    client = speech.AdaptationClient()
+    from google.cloud import speech_v1 as speech
+
+    client = _get_adaptation_client()
 
     parent = client.common_location_path(project_id, location="global")
 
-    custom_class = speech.CustomClass(
-        items=[
-            speech.CustomClass.ClassItem(value="Google"),
-            speech.CustomClass.ClassItem(value="Alphabet"),
-            speech.CustomClass.ClassItem(value="DeepMind"),
-        ],
+    # Populate the repeated items field in a single extend call.
+    custom_class = speech.CustomClass()
+    custom_class.items.extend(
+        speech.CustomClass.ClassItem(value=value)
+        for value in ("Google", "Alphabet", "DeepMind")
     )
 
     request = speech.CreateCustomClassRequest(
@@ -81,8 +94,6 @@ def create_custom_class(
         print(f"An API error occurred: {e.message}", file=sys.stderr)
         print(f"Error code: {e.code}", file=sys.stderr)
         print("Please check your request parameters and permissions.", file=sys.stderr)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_customclass_create]
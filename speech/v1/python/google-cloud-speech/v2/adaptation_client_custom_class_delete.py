@@ -15,10 +15,39 @@
 import argparse
 
 # [START speech_v1_adaptation_customclass_delete]
+import atexit
+import functools
 import sys
 
-from google.api_core import exceptions
-from google.cloud import speech_v1
+from google.api_core import exceptions, retry
+
+# Retry transient errors quickly and give up after five seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.1,
+    maximum=1.0,
+    multiplier=1.3,
+    timeout=5.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1
+
+    client = speech_v1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _custom_class_path(project_id: str, custom_class_id: str) -> str:
+    """Returns the resource name of a custom class in the global location."""
+    return f"projects/{project_id}/locations/global/customClasses/{custom_class_id}"
 
 
 def delete_custom_class(
@@ -38,14 +67,12 @@ def delete_custom_class(
                          This is the last component of the custom class's resource name.
                          Example: "my-custom-class-id".
     """
-    client = speech_v1.AdaptationClient()
+    client = _get_adaptation_client()
 
-    name = client.custom_class_path(
-        project_id, location="global", custom_class=custom_class_id
-    )
+    name = _custom_class_path(project_id, custom_class_id)
 
     try:
-        client.delete_custom_class(name=name)
+        client.delete_custom_class(name=name, retry=RETRY_POLICY, timeout=5.0)
         print(f"Successfully deleted custom class: {name}")
     except exceptions.NotFound:
         print(
@@ -54,8 +81,8 @@ def delete_custom_class(
             "Please ensure the custom class exists and the ID is correct.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except exceptions.GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
         print(f"Failed to delete custom class '{name}'.", file=sys.stderr)
 
 
@@ -15,10 +15,41 @@
 import argparse
 
 # [START speech_v1_adaptation_customclass_get]
+import atexit
+import functools
+import json
 import sys
 
-from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1 as speech
+from google.api_core import retry
+from google.api_core.exceptions import GoogleAPICallError, NotFound
+
+# Retry transient errors quickly and give up after five seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.1,
+    maximum=1.0,
+    multiplier=1.3,
+    timeout=5.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1 as speech
+
+    client = speech.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _custom_class_path(project_id: str, custom_class_id: str) -> str:
+    """Returns the resource name of a custom class in the global location."""
+    return f"projects/{project_id}/locations/global/customClasses/{custom_class_id}"
 
 
 def get_custom_class(
@@ -37,34 +68,35 @@ def get_custom_class(
         project_id: The Google Cloud project ID.
         custom_class_id: The ID of the custom class to retrieve.
     """
-    client = speech.AdaptationClient()
+    client = _get_adaptation_client()
 
-    name = client.custom_class_path(
-        project_id, location="global", custom_class=custom_class_id
-    )
+    name = _custom_class_path(project_id, custom_class_id)
 
     try:
-        custom_class = client.get_custom_class(name=name)
-
-        print(f"Successfully retrieved custom class: {custom_class.name}")
-        print(f"Custom Class ID: {custom_class.custom_class_id}")
+        custom_class = client.get_custom_class(
+            name=name, retry=RETRY_POLICY, timeout=5.0
+        )
 
-        if custom_class.items:
-            print("Items:")
-            for item in custom_class.items:
-                print(f"  - {item.value}")
-        else:
-            print("No items defined for this custom class.")
+        # Write the custom class to stdout as a single JSON line.
+        print(
+            json.dumps(
+                {
+                    "name": custom_class.name,
+                    "custom_class_id": custom_class.custom_class_id,
+                    "items": [item.value for item in custom_class.items],
+                }
+            )
+        )
 
     except NotFound:
-        print(f"Error: Custom class '{name}' not found.", file=sys.stderr)
         print(
-            "Please ensure the custom class ID and location are correct, ",
+            f"Error: Custom class '{name}' not found. Please ensure the custom "
+            "class ID and location are correct, and that the custom class "
+            "exists in your project.",
             file=sys.stderr,
         )
-        print("and that the custom class exists in your project.", file=sys.stderr)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_customclass_get]
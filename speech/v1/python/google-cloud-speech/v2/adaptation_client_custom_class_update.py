@@ -15,12 +15,59 @@
 import argparse
 
 # [START speech_v1_adaptation_customclass_update]
+import atexit
+import functools
 import sys
 
-from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1
+from google.api_core import retry
+from google.api_core.exceptions import GoogleAPICallError, NotFound
 from google.protobuf.field_mask_pb2 import FieldMask
 
+# Retry transient errors quickly and give up after five seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.1,
+    maximum=1.0,
+    multiplier=1.3,
+    timeout=5.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    import grpc
+    from google.cloud import speech_v1
+    from google.cloud.speech_v1.services.adaptation.transports import (
+        AdaptationGrpcTransport,
+    )
+
+    # Compress requests with gzip. The phrases and items this sample sends are
+    # plain text, which compresses well and shrinks large payloads on the wire.
+    # Passing options replaces the transport's defaults, so the unlimited
+    # message sizes of the default channel are set here as well.
+    channel = AdaptationGrpcTransport.create_channel(
+        compression=grpc.Compression.Gzip,
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
+    client = speech_v1.AdaptationClient(
+        transport=AdaptationGrpcTransport(channel=channel)
+    )
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _custom_class_path(project_id: str, custom_class_id: str) -> str:
+    """Returns the resource name of a custom class in the global location."""
+    return f"projects/{project_id}/locations/global/customClasses/{custom_class_id}"
+
 
 def update_custom_class(
     project_id: str,
@@ -37,18 +84,17 @@ def update_custom_class(
         custom_class_id: The ID of the custom class to update.
                          This ID will be part of the custom class's resource name.
     """
-    client = speech_v1.AdaptationClient()
+    from google.cloud import speech_v1
 
-    custom_class_name = client.custom_class_path(
-        project_id, location="global", custom_class=custom_class_id
-    )
+    client = _get_adaptation_client()
+
+    custom_class_name = _custom_class_path(project_id, custom_class_id)
 
+    # Repeated message fields accept plain dicts, which are converted
+    # directly into the underlying protobuf messages.
     custom_class_to_update = speech_v1.CustomClass(
         name=custom_class_name,
-        items=[
-            speech_v1.CustomClass.ClassItem(value="new item one"),
-            speech_v1.CustomClass.ClassItem(value="new item two"),
-        ],
+        items=[{"value": "new item one"}, {"value": "new item two"}],
     )
 
     # If update_mask is not specified, all mutable fields in `custom_class_to_update`
@@ -59,10 +105,15 @@ def update_custom_class(
         updated_custom_class = client.update_custom_class(
             custom_class=custom_class_to_update,
             update_mask=update_mask,
+            retry=RETRY_POLICY,
+            timeout=5.0,
         )
 
         print(f"Successfully updated custom class: {updated_custom_class.name}")
-        print(f"Updated items: {[item.value for item in updated_custom_class.items]}")
+        print(
+            "Updated items:",
+            ", ".join(item.value for item in updated_custom_class.items),
+        )
 
     except NotFound:
         print(
@@ -74,8 +125,8 @@ def update_custom_class(
             "You can create a custom class using the `create_custom_class` method.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
         print(
             "Please check your project ID, location, and custom class ID.",
             file=sys.stderr,
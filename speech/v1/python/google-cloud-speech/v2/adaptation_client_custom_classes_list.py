@@ -15,10 +15,24 @@
 import argparse
 
 # [START speech_v1_adaptation_customclasses_list]
+import atexit
+import functools
+import json
 import sys
 
 from google.api_core import exceptions
-from google.cloud import speech_v1
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1
+
+    client = speech_v1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def list_custom_classes(
@@ -30,17 +44,39 @@ def list_custom_classes(
     Args:
         project_id: The Google Cloud project ID.
     """
-    client = speech_v1.AdaptationClient()
+    from google.cloud import speech_v1
+
+    client = _get_adaptation_client()
 
     parent = f"projects/{project_id}/locations/global"
 
     try:
-        page_result = client.list_custom_classes(parent=parent)
+        # Request the largest page the service allows (1000) so that large
+        # projects need as few round trips as possible.
+        page_result = client.list_custom_classes(
+            request={"parent": parent, "page_size": 1000}
+        )
 
+        # Write each page to stdout with a single call, one JSON line per
+        # custom class, instead of one print() per custom class. Read the
+        # fields from the raw protobuf response (ListCustomClassesResponse.pb)
+        # so each custom class and item is not wrapped in a proto-plus object
+        # just to read its values.
         found_custom_classes = False
-        for custom_class in page_result:
-            found_custom_classes = True
-            print(f"  Found Custom Class: {custom_class.name}")
+        for page in page_result.pages:
+            raw_page = speech_v1.ListCustomClassesResponse.pb(page)
+            records = [
+                json.dumps(
+                    {
+                        "name": custom_class.name,
+                        "items": [item.value for item in custom_class.items],
+                    }
+                )
+                for custom_class in raw_page.custom_classes
+            ]
+            if records:
+                found_custom_classes = True
+                sys.stdout.write("".join(f"{record}\n" for record in records))
 
         if not found_custom_classes:
             print(f"No custom classes found for project {project_id}.")
@@ -51,8 +87,8 @@ def list_custom_classes(
             "or contains no custom classes. Please check the project ID",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except exceptions.GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_customclasses_list]
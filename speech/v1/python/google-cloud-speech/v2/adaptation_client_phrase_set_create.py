@@ -15,10 +15,38 @@
 import argparse
 
 # [START speech_v1_adaptation_phraseset_create]
+import atexit
+import functools
 import sys
 
 from google.api_core import exceptions
-from google.cloud import speech_v1p1beta1 as speech
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    import grpc
+    from google.cloud import speech_v1p1beta1 as speech
+    from google.cloud.speech_v1p1beta1.services.adaptation.transports import (
+        AdaptationGrpcTransport,
+    )
+
+    # Compress requests with gzip. The phrases and items this sample sends are
+    # plain text, which compresses well and shrinks large payloads on the wire.
+    # Passing options replaces the transport's defaults, so the unlimited
+    # message sizes of the default channel are set here as well.
+    channel = AdaptationGrpcTransport.create_channel(
+        compression=grpc.Compression.Gzip,
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
+    client = speech.AdaptationClient(transport=AdaptationGrpcTransport(channel=channel))
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def create_phrase_set(
@@ -35,17 +63,20 @@ def create_phrase_set(
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID to use for the new PhraseSet.
     """
-    client = speech.AdaptationClient()
+    from google.cloud import speech_v1p1beta1 as speech
+
+    client = _get_adaptation_client()
 
     # Construct the full location path.
     parent = f"projects/{project_id}/locations/global"
 
-    # Create the PhraseSet object.
+    # Create the PhraseSet object. Repeated message fields accept plain dicts,
+    # which are converted directly into the underlying protobuf messages.
     phrase_set = speech.PhraseSet(
         phrases=[
-            speech.PhraseSet.Phrase(value="Google Cloud"),
-            speech.PhraseSet.Phrase(value="Speech-to-Text API", boost=10.0),
-            speech.PhraseSet.Phrase(value="adaptation"),
+            {"value": "Google Cloud"},
+            {"value": "Speech-to-Text API", "boost": 10.0},
+            {"value": "adaptation"},
         ]
     )
 
@@ -60,7 +91,7 @@ def create_phrase_set(
         response = client.create_phrase_set(request=request)
 
         print(f"Successfully created PhraseSet: {response.name}")
-        print(f"Phrases: {[p.value for p in response.phrases]}")
+        print("Phrases:", ", ".join(p.value for p in response.phrases))
 
     except exceptions.AlreadyExists as e:
         print(
@@ -74,8 +105,8 @@ def create_phrase_set(
             file=sys.stderr,
         )
         print("Please ensure the phrase_set_id is valid.", file=sys.stderr)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except exceptions.GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_phraseset_create]
@@ -15,10 +15,40 @@
 import argparse
 
 # [START speech_v1_adaptation_phraseset_delete]
+import atexit
+import functools
 import sys
 
-from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1
+from google.api_core import retry
+from google.api_core.exceptions import GoogleAPICallError, NotFound
+
+# Retry transient errors quickly and give up after five seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.1,
+    maximum=1.0,
+    multiplier=1.3,
+    timeout=5.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1
+
+    client = speech_v1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _phrase_set_path(project_id: str, phrase_set_id: str) -> str:
+    """Returns the resource name of a phrase set in the global location."""
+    return f"projects/{project_id}/locations/global/phraseSets/{phrase_set_id}"
 
 
 def delete_phrase_set(project_id: str, phrase_set_id: str) -> None:
@@ -28,22 +58,20 @@ def delete_phrase_set(project_id: str, phrase_set_id: str) -> None:
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID of the phrase set to delete.
     """
-    client = speech_v1.AdaptationClient()
+    client = _get_adaptation_client()
 
     # Construct the full resource name of the phrase set.
-    name = client.phrase_set_path(
-        project_id, location="global", phrase_set=phrase_set_id
-    )
+    name = _phrase_set_path(project_id, phrase_set_id)
 
     try:
-        client.delete_phrase_set(name=name)
+        client.delete_phrase_set(name=name, retry=RETRY_POLICY, timeout=5.0)
         print(f"Phrase set {name} deleted successfully.")
     except NotFound:
         print(
             f"Phrase set {name} not found. It might have already been deleted or never existed.",
             file=sys.stderr,
         )
-    except Exception as e:
+    except GoogleAPICallError as e:
         print(
             f"An error occurred while deleting phrase set {name}: {e}", file=sys.stderr
         )
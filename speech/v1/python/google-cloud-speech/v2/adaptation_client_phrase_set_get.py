@@ -15,10 +15,41 @@
 import argparse
 
 # [START speech_v1_adaptation_phraseset_get]
+import atexit
+import functools
+import json
 import sys
 
-from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1p1beta1 as speech
+from google.api_core import retry
+from google.api_core.exceptions import GoogleAPICallError, NotFound
+
+# Retry transient errors quickly and give up after five seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.1,
+    maximum=1.0,
+    multiplier=1.3,
+    timeout=5.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1 as speech
+
+    client = speech.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _phrase_set_path(project_id: str, phrase_set_id: str) -> str:
+    """Returns the resource name of a phrase set in the global location."""
+    return f"projects/{project_id}/locations/global/phraseSets/{phrase_set_id}"
 
 
 def get_phrase_set(
@@ -36,38 +67,40 @@ def get_phrase_set(
         phrase_set_id: The ID of the phrase set to retrieve.
                        Format: 'your-phrase-set-id'
     """
-    client = speech.AdaptationClient()
+    client = _get_adaptation_client()
 
     # Construct the full resource name of the phrase set.
-    phrase_set_name = client.phrase_set_path(
-        project_id, location="global", phrase_set=phrase_set_id
-    )
+    phrase_set_name = _phrase_set_path(project_id, phrase_set_id)
 
     try:
-        phrase_set = client.get_phrase_set(name=phrase_set_name)
-
-        print(f"Successfully retrieved phrase set: {phrase_set.name}")
-        print(f"Display Name: {phrase_set.display_name}")
-        if phrase_set.phrases:
-            print("Phrases:")
-            for phrase in phrase_set.phrases:
-                print(f"  - Value: '{phrase.value}', Boost: {phrase.boost}")
-        else:
-            print("No phrases found in this phrase set.")
-        print(f"Boost: {phrase_set.boost}")
+        phrase_set = client.get_phrase_set(
+            name=phrase_set_name, retry=RETRY_POLICY, timeout=5.0
+        )
 
-    except NotFound:
-        print(f"Error: Phrase set '{phrase_set_name}' not found.", file=sys.stderr)
+        # Write the phrase set to stdout as a single JSON line.
         print(
-            "Please ensure the project ID, location, and phrase set ID are correct.",
-            file=sys.stderr,
+            json.dumps(
+                {
+                    "name": phrase_set.name,
+                    "display_name": phrase_set.display_name,
+                    "boost": phrase_set.boost,
+                    "phrases": [
+                        {"value": phrase.value, "boost": phrase.boost}
+                        for phrase in phrase_set.phrases
+                    ],
+                }
+            )
         )
+
+    except NotFound:
         print(
-            "You might need to create the phrase set first if it does not exist.",
+            f"Error: Phrase set '{phrase_set_name}' not found. Please ensure the "
+            "project ID, location, and phrase set ID are correct. You might need "
+            "to create the phrase set first if it does not exist.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_phraseset_get]
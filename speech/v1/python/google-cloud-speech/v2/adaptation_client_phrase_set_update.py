@@ -15,12 +15,58 @@
 import argparse
 
 # [START speech_v1_adaptation_phraseset_update]
+import atexit
+import functools
 import sys
 
-from google.api_core import exceptions
-from google.cloud import speech_v1
+from google.api_core import exceptions, retry
 from google.protobuf import field_mask_pb2
 
+# Retry transient errors quickly and give up after five seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.1,
+    maximum=1.0,
+    multiplier=1.3,
+    timeout=5.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    import grpc
+    from google.cloud import speech_v1
+    from google.cloud.speech_v1.services.adaptation.transports import (
+        AdaptationGrpcTransport,
+    )
+
+    # Compress requests with gzip. The phrases and items this sample sends are
+    # plain text, which compresses well and shrinks large payloads on the wire.
+    # Passing options replaces the transport's defaults, so the unlimited
+    # message sizes of the default channel are set here as well.
+    channel = AdaptationGrpcTransport.create_channel(
+        compression=grpc.Compression.Gzip,
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
+    client = speech_v1.AdaptationClient(
+        transport=AdaptationGrpcTransport(channel=channel)
+    )
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _phrase_set_path(project_id: str, phrase_set_id: str) -> str:
+    """Returns the resource name of a phrase set in the global location."""
+    return f"projects/{project_id}/locations/global/phraseSets/{phrase_set_id}"
+
 
 def update_phrase_set(
     project_id: str,
@@ -38,21 +84,27 @@ def update_phrase_set(
         new_phrases: A list of strings representing the new phrases to set in
                      the PhraseSet.
     """
-    client = speech_v1.AdaptationClient()
+    # With no phrases, the update would only clear the phrase set, so skip the
+    # request entirely.
+    if not new_phrases:
+        print("No phrases provided; skipping update.", file=sys.stderr)
+        return
 
-    # Construct the full resource name of the phrase set
-    phrase_set_name = client.phrase_set_path(
-        project_id, location="global", phrase_set=phrase_set_id
-    )
+    from google.cloud import speech_v1
+
+    client = _get_adaptation_client()
 
-    # Create Phrase objects from the new_phrases list
-    phrases_for_update = [
-        speech_v1.PhraseSet.Phrase(value=phrase) for phrase in new_phrases
-    ]
+    # Construct the full resource name of the phrase set
+    phrase_set_name = _phrase_set_path(project_id, phrase_set_id)
 
     # Create a PhraseSet object with the name and the updated phrases
     # The name is crucial for identifying which PhraseSet to update.
-    phrase_set = speech_v1.PhraseSet(name=phrase_set_name, phrases=phrases_for_update)
+    # Repeated message fields accept plain dicts, which are converted
+    # directly into the underlying protobuf messages.
+    phrase_set = speech_v1.PhraseSet(
+        name=phrase_set_name,
+        phrases=[{"value": phrase} for phrase in new_phrases],
+    )
 
     # Create an update mask to specify that only the 'phrases' field should be updated.
     # If you wanted to update other fields (e.g., 'boost'), you would add them here.
@@ -65,13 +117,14 @@ def update_phrase_set(
 
     try:
         # Make the API call
-        response = client.update_phrase_set(request=request)
+        response = client.update_phrase_set(
+            request=request, retry=RETRY_POLICY, timeout=5.0
+        )
 
         # Print the response details
         print(f"Successfully updated phrase set: {response.name}")
         print("Updated phrases:")
-        for phrase in response.phrases:
-            print(f"- {phrase.value}")
+        sys.stdout.write("".join(f"- {phrase.value}\n" for phrase in response.phrases))
 
     except exceptions.NotFound:
         print(f"Error: Phrase set '{phrase_set_name}' not found.", file=sys.stderr)
@@ -83,8 +136,8 @@ def update_phrase_set(
             "You might need to create the phrase set first if it doesn't exist.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except exceptions.GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_phraseset_update]
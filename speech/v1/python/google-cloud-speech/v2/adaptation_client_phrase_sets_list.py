@@ -15,10 +15,29 @@
 import argparse
 
 # [START speech_v1_adaptation_phraseset_list]
+import atexit
+import functools
+import json
 import sys
 
-from google.api_core.exceptions import InvalidArgument, NotFound, PermissionDenied
-from google.cloud import speech_v1 as speech
+from google.api_core.exceptions import (
+    GoogleAPICallError,
+    InvalidArgument,
+    NotFound,
+    PermissionDenied,
+)
+
+
+@functools.cache
+def _get_adaptation_client():
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1 as speech
+
+    client = speech.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def list_phrase_sets(
@@ -30,21 +49,41 @@ def list_phrase_sets(
     Args:
         project_id: The Google Cloud project ID.
     """
-    client = speech.AdaptationClient()
+    from google.cloud import speech_v1 as speech
+
+    client = _get_adaptation_client()
 
     # Construct the parent path for the request.
     parent = client.common_location_path(project=project_id, location="global")
 
     try:
         # Send the ListPhraseSet request.
-        # The response is a paginated iterable of PhraseSet objects.
-        page_result = client.list_phrase_set(parent=parent)
+        # The response is a paginated iterable of PhraseSet objects. Request
+        # the largest page the service allows (1000) so that large projects
+        # need as few round trips as possible.
+        page_result = client.list_phrase_set(
+            request={"parent": parent, "page_size": 1000}
+        )
 
-        print(f"PhraseSets found in {parent}:")
+        # Write each page to stdout with a single call, one JSON line per
+        # phrase set, instead of one print() per phrase set. Read the fields
+        # from the raw protobuf response (ListPhraseSetResponse.pb) so each
+        # phrase set and phrase is not wrapped in a proto-plus object just to
+        # read its values.
         found_any = False
-        for phrase_set in page_result:
-            found_any = True
-            print(f"- {phrase_set.name}")
+        for page in page_result.pages:
+            records = [
+                json.dumps(
+                    {
+                        "name": phrase_set.name,
+                        "phrases": [phrase.value for phrase in phrase_set.phrases],
+                    }
+                )
+                for phrase_set in speech.ListPhraseSetResponse.pb(page).phrase_sets
+            ]
+            if records:
+                found_any = True
+                sys.stdout.write("".join(f"{record}\n" for record in records))
 
         if not found_any:
             print(f"No PhraseSets found in {parent}.")
@@ -67,8 +106,8 @@ def list_phrase_sets(
             f"Please check the format of the project ID and location. Details: {e}",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except GoogleAPICallError as e:
+        print(f"An API error occurred: {e}", file=sys.stderr)
 
 
 # [END speech_v1_adaptation_phraseset_list]
@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+
+# [START speech_v1_adaptation_shared_channel]
+import sys
+
+from google.api_core.exceptions import NotFound
+from google.cloud import speech_v1, speech_v1p1beta1
+from google.cloud.speech_v1.services.adaptation.transports import (
+    AdaptationGrpcTransport as V1AdaptationGrpcTransport,
+)
+from google.cloud.speech_v1p1beta1.services.adaptation.transports import (
+    AdaptationGrpcTransport as V1p1beta1AdaptationGrpcTransport,
+)
+
+
+def get_custom_class_and_phrase_set(
+    project_id: str,
+    custom_class_id: str,
+    phrase_set_id: str,
+) -> None:
+    """Retrieves a custom class and a phrase set over a single gRPC channel.
+
+    The v1 and v1p1beta1 Adaptation APIs are served from the same endpoint, so
+    clients for both versions can share one channel. This avoids opening a
+    second connection and repeating the TLS handshake.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        custom_class_id: The ID of the custom class to retrieve with the v1 API.
+        phrase_set_id: The ID of the phrase set to retrieve with the v1p1beta1 API.
+    """
+    # Create one channel using Application Default Credentials and hand it to
+    # a transport for each API version. A channel passed in this way does not
+    # get the transport's default options, so the unlimited message sizes of
+    # the default channel are set here.
+    channel = V1AdaptationGrpcTransport.create_channel(
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ]
+    )
+    v1_client = speech_v1.AdaptationClient(
+        transport=V1AdaptationGrpcTransport(channel=channel)
+    )
+    v1p1beta1_client = speech_v1p1beta1.AdaptationClient(
+        transport=V1p1beta1AdaptationGrpcTransport(channel=channel)
+    )
+
+    custom_class_name = v1_client.custom_class_path(
+        project_id, location="global", custom_class=custom_class_id
+    )
+    phrase_set_name = v1p1beta1_client.phrase_set_path(
+        project_id, location="global", phrase_set=phrase_set_id
+    )
+
+    try:
+        custom_class = v1_client.get_custom_class(name=custom_class_name)
+        print(f"Retrieved custom class (v1): {custom_class.name}")
+
+        phrase_set = v1p1beta1_client.get_phrase_set(name=phrase_set_name)
+        print(f"Retrieved phrase set (v1p1beta1): {phrase_set.name}")
+    except NotFound as e:
+        print(f"Error: Resource not found: {e}", file=sys.stderr)
+    finally:
+        channel.close()
+
+
+# [END speech_v1_adaptation_shared_channel]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Retrieve a custom class and a phrase set over one gRPC channel."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--custom_class_id",
+        type=str,
+        required=True,
+        help="The ID of the custom class to retrieve.",
+    )
+    parser.add_argument(
+        "--phrase_set_id",
+        type=str,
+        required=True,
+        help="The ID of the phrase set to retrieve.",
+    )
+
+    args = parser.parse_args()
+
+    get_custom_class_and_phrase_set(
+        args.project_id, args.custom_class_id, args.phrase_set_id
+    )
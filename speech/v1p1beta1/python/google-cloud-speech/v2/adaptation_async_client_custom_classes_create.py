@@ -0,0 +1,147 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v1p1beta1_adaptation_customclasses_create_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# The maximum number of create requests that batch_create_custom_classes keeps
+# in flight at once.
+MAX_CONCURRENT_CREATES = 50
+
+
+async def _create_custom_class_async(
+    client: speech_v1p1beta1.AdaptationAsyncClient,
+    parent: str,
+    custom_class_id: str,
+    items: list[str],
+    semaphore: asyncio.Semaphore,
+) -> speech_v1p1beta1.CustomClass:
+    """Creates one custom class once a request slot is free."""
+    from google.cloud import speech_v1p1beta1
+
+    async with semaphore:
+        return await client.create_custom_class(
+            parent=parent,
+            custom_class_id=custom_class_id,
+            custom_class=speech_v1p1beta1.CustomClass(
+                items=[{"value": item} for item in items]
+            ),
+        )
+
+
+async def batch_create_custom_classes(
+    project_id: str,
+    specs: list[tuple[str, list[str]]],
+) -> None:
+    """
+    Creates several custom classes concurrently.
+
+    The Adaptation API has no batch create method, so this sends one create
+    request per custom class over a single AdaptationAsyncClient. The requests
+    are multiplexed over one connection and their round trips overlap instead
+    of running back to back.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        specs: (custom_class_id, items) pairs, one for each custom class to
+            create.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationAsyncClient()
+    parent = client.common_location_path(project_id, location="global")
+
+    # Keep at most MAX_CONCURRENT_CREATES requests in flight at once.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CREATES)
+    try:
+        # return_exceptions=True keeps one failed create from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(
+                _create_custom_class_async(
+                    client, parent, custom_class_id, items, semaphore
+                )
+                for custom_class_id, items in specs
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for (custom_class_id, _), result in zip(specs, results):
+        if isinstance(result, exceptions.AlreadyExists):
+            print(
+                f"Custom class '{custom_class_id}' already exists in '{parent}'.",
+                file=sys.stderr,
+            )
+        elif isinstance(result, exceptions.GoogleAPICallError):
+            print(
+                f"Error creating custom class '{custom_class_id}': {result}",
+                file=sys.stderr,
+            )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Created custom class: {result.name}")
+
+
+# [END speech_v1p1beta1_adaptation_customclasses_create_async]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Creates several custom classes for speech adaptation concurrently."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="Your Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--custom_class_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="Comma-separated list of IDs for the custom classes to create.",
+    )
+    parser.add_argument(
+        "--items",
+        type=lambda value: value.split(","),
+        default=["Google", "Alphabet", "DeepMind"],
+        help="Comma-separated list of items to include in each custom class.",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        batch_create_custom_classes(
+            project_id=args.project_id,
+            specs=[
+                (custom_class_id, args.items)
+                for custom_class_id in args.custom_class_ids
+            ],
+        )
+    )
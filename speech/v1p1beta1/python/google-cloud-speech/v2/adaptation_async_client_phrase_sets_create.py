@@ -0,0 +1,142 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v1p1beta1_adaptation_phrasesets_create_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core.exceptions import AlreadyExists, GoogleAPICallError
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# The maximum number of create requests that batch_create_phrase_sets keeps in
+# flight at once.
+MAX_CONCURRENT_CREATES = 50
+
+
+async def _create_phrase_set_async(
+    client: speech_v1p1beta1.AdaptationAsyncClient,
+    parent: str,
+    phrase_set_id: str,
+    phrases: list[str],
+    semaphore: asyncio.Semaphore,
+) -> speech_v1p1beta1.PhraseSet:
+    """Creates one phrase set once a request slot is free."""
+    from google.cloud.speech_v1p1beta1 import types
+
+    async with semaphore:
+        return await client.create_phrase_set(
+            parent=parent,
+            phrase_set_id=phrase_set_id,
+            phrase_set=types.PhraseSet(phrases=[{"value": p} for p in phrases]),
+        )
+
+
+async def batch_create_phrase_sets(
+    project_id: str,
+    specs: list[tuple[str, list[str]]],
+) -> None:
+    """Creates several phrase sets concurrently.
+
+    The Adaptation API has no batch create method, so this sends one create
+    request per phrase set over a single AdaptationAsyncClient. The requests
+    are multiplexed over one connection and their round trips overlap instead
+    of running back to back.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        specs: (phrase_set_id, phrases) pairs, one for each phrase set to
+            create.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationAsyncClient()
+    parent = client.common_location_path(project_id, location="global")
+
+    # Keep at most MAX_CONCURRENT_CREATES requests in flight at once.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CREATES)
+    try:
+        # return_exceptions=True keeps one failed create from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(
+                _create_phrase_set_async(
+                    client, parent, phrase_set_id, phrases, semaphore
+                )
+                for phrase_set_id, phrases in specs
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for (phrase_set_id, _), result in zip(specs, results):
+        if isinstance(result, AlreadyExists):
+            print(
+                f"Phrase set '{phrase_set_id}' already exists in '{project_id}'.",
+                file=sys.stderr,
+            )
+        elif isinstance(result, GoogleAPICallError):
+            print(
+                f"Error creating phrase set '{phrase_set_id}': {result}",
+                file=sys.stderr,
+            )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Successfully created phrase set: {result.name}")
+
+
+# [END speech_v1p1beta1_adaptation_phrasesets_create_async]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Creates several phrase sets for Speech-to-Text adaptation "
+        "concurrently."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--phrase_set_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="Comma-separated list of IDs for the phrase sets to create.",
+    )
+    parser.add_argument(
+        "--phrases",
+        type=lambda value: value.split(","),
+        default=["hello world", "goodbye moon"],
+        help="Comma-separated list of phrases to include in each phrase set.",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        batch_create_phrase_sets(
+            args.project_id,
+            [(phrase_set_id, args.phrases) for phrase_set_id in args.phrase_set_ids],
+        )
+    )
@@ -12,18 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_customclass_create]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
 from google.api_core import exceptions
-from google.cloud import speech_v1p1beta1
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def create_custom_class(
     project_id: str,
     custom_class_id: str,
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
 ) -> None:
     """
     Create a custom class for speech adaptation.
@@ -36,17 +57,23 @@ def create_custom_class(
         project_id: The Google Cloud project ID.
         custom_class_id: The ID to use for the custom class, which will become
             the final component of the custom class's resource name.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
-    client = speech_v1p1beta1.AdaptationClient()
+    from google.cloud import speech_v1p1beta1
+
+    if client is None:
+        client = _get_adaptation_client()
 
     parent = client.common_location_path(project_id, location="global")
 
-    custom_class = speech_v1p1beta1.CustomClass(
-        items=[
-            speech_v1p1beta1.CustomClass.ClassItem(value="Google"),
-            speech_v1p1beta1.CustomClass.ClassItem(value="Alphabet"),
-            speech_v1p1beta1.CustomClass.ClassItem(value="DeepMind"),
-        ],
+    item_values = ("Google", "Alphabet", "DeepMind")
+
+    # Populate the repeated items field in a single extend call.
+    custom_class = speech_v1p1beta1.CustomClass()
+    custom_class.items.extend(
+        speech_v1p1beta1.CustomClass.ClassItem(value=value) for value in item_values
     )
 
     try:
@@ -57,9 +84,10 @@ def create_custom_class(
         )
 
         print(f"Created custom class: {response.name}")
-        print("Items:")
-        for item in response.items:
-            print(f"- {item.value}")
+        # On success the service stores the items exactly as sent, so print
+        # them from the local values rather than wrapping each item in the
+        # response. Write them with one call instead of one print() per item.
+        sys.stdout.write("Items:\n" + "".join(f"- {value}\n" for value in item_values))
 
     except exceptions.AlreadyExists as e:
         print(
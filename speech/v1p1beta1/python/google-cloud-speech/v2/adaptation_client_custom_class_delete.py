@@ -12,18 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_customclass_delete]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core import retry
 from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1p1beta1 as speech
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1 as speech
+
+# Retry transient errors quickly and give up after 15 seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.2,
+    maximum=2.0,
+    multiplier=1.3,
+    timeout=15.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client() -> speech.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1 as speech
+
+    client = speech.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _custom_class_path(project_id: str, custom_class_id: str) -> str:
+    """Returns the resource name of a custom class in the global location."""
+    return f"projects/{project_id}/locations/global/customClasses/{custom_class_id}"
 
 
 def delete_custom_class(
     project_id: str,
     custom_class_id: str,
+    *,
+    client: speech.AdaptationClient | None = None,
 ) -> None:
     """
     Deletes a custom class from a Google Cloud project.
@@ -34,15 +72,17 @@ def delete_custom_class(
     Args:
         project_id: The Google Cloud project ID.
         custom_class_id: The ID of the custom class to delete.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
-    client = speech.AdaptationClient()
+    if client is None:
+        client = _get_adaptation_client()
 
-    name = client.custom_class_path(
-        project_id, location="global", custom_class=custom_class_id
-    )
+    name = _custom_class_path(project_id, custom_class_id)
 
     try:
-        client.delete_custom_class(name=name)
+        client.delete_custom_class(name=name, retry=RETRY_POLICY, timeout=10.0)
         print(f"Successfully deleted custom class: {name}")
     except NotFound:
         print(
@@ -12,37 +12,79 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_customclass_get]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions, retry
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# Retry transient errors quickly and give up after 15 seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.2,
+    maximum=2.0,
+    multiplier=1.3,
+    timeout=15.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
 
-from google.api_core import exceptions
-from google.cloud import speech_v1p1beta1
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _custom_class_path(project_id: str, custom_class_id: str) -> str:
+    """Returns the resource name of a custom class in the global location."""
+    return f"projects/{project_id}/locations/global/customClasses/{custom_class_id}"
 
 
-def get_custom_class(project_id: str, custom_class_id: str) -> None:
+def get_custom_class(
+    project_id: str,
+    custom_class_id: str,
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
+) -> None:
     """Retrieves a custom class from Google Cloud Speech-to-Text.
 
     Args:
         project_id: The Google Cloud project ID.
         custom_class_id: The ID of the custom class to retrieve.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
-    client = speech_v1p1beta1.AdaptationClient()
+    if client is None:
+        client = _get_adaptation_client()
 
-    name = client.custom_class_path(
-        project=project_id, location="global", custom_class=custom_class_id
-    )
+    name = _custom_class_path(project_id, custom_class_id)
 
     try:
-        custom_class = client.get_custom_class(name=name)
+        custom_class = client.get_custom_class(
+            name=name, retry=RETRY_POLICY, timeout=10.0
+        )
 
         print(f"Successfully retrieved custom class: {custom_class.name}")
         print(f"Display Name: {custom_class.display_name}")
         if custom_class.items:
-            print("Items:")
-            for item in custom_class.items:
-                print(f"  - {item.value}")
+            print("Items:", ", ".join(item.value for item in custom_class.items))
         else:
             print("No items found in this custom class.")
 
@@ -0,0 +1,165 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v1p1beta1_adaptation_customclasses_create_pooled]
+import concurrent.futures
+import itertools
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+
+def _make_pooled_adaptation_clients(
+    pool_size: int,
+) -> list[speech_v1p1beta1.AdaptationClient]:
+    """Returns pool_size clients, each with its own gRPC connection.
+
+    By default gRPC shares connections between channels created with the same
+    arguments. Giving each channel a local subchannel pool makes it open its
+    own connection, so concurrent requests are spread over several HTTP/2
+    connections instead of contending for the flow-control window of one.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+    from google.cloud.speech_v1p1beta1.services.adaptation.transports import (
+        AdaptationGrpcTransport,
+    )
+
+    clients = []
+    for _ in range(pool_size):
+        # Passing options replaces the transport's defaults, so the unlimited
+        # message sizes of the default channel are set here as well.
+        channel = AdaptationGrpcTransport.create_channel(
+            options=[
+                ("grpc.use_local_subchannel_pool", 1),
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+            ]
+        )
+        clients.append(
+            speech_v1p1beta1.AdaptationClient(
+                transport=AdaptationGrpcTransport(channel=channel)
+            )
+        )
+    return clients
+
+
+def create_custom_classes(
+    project_id: str,
+    custom_class_ids: list[str],
+    pool_size: int = 4,
+) -> None:
+    """Creates several custom classes in parallel over a pool of connections.
+
+    A single client is enough for scripts that send one request at a time.
+    A pool only pays off for bulk workloads, such as provisioning hundreds of
+    custom classes, where many requests are in flight at once.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        custom_class_ids: The IDs to use for the new custom classes.
+        pool_size: The number of connections to spread the requests over.
+
+    Raises:
+        ValueError: If pool_size is less than 1.
+    """
+    if pool_size < 1:
+        raise ValueError(f"pool_size must be at least 1, got {pool_size}.")
+
+    from google.cloud import speech_v1p1beta1
+
+    clients = _make_pooled_adaptation_clients(pool_size)
+    parent = clients[0].common_location_path(project_id, location="global")
+    custom_class = speech_v1p1beta1.CustomClass(
+        items=[{"value": "Google"}, {"value": "Alphabet"}, {"value": "DeepMind"}],
+    )
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=pool_size * 8) as pool:
+            # Hand the clients out in round-robin order, one per request.
+            futures = {
+                pool.submit(
+                    client.create_custom_class,
+                    parent=parent,
+                    custom_class_id=custom_class_id,
+                    custom_class=custom_class,
+                ): custom_class_id
+                for client, custom_class_id in zip(
+                    itertools.cycle(clients), custom_class_ids
+                )
+            }
+            for future in concurrent.futures.as_completed(futures):
+                custom_class_id = futures[future]
+                try:
+                    response = future.result()
+                except exceptions.AlreadyExists:
+                    print(
+                        f"Custom class '{custom_class_id}' already exists in "
+                        f"'{parent}'.",
+                        file=sys.stderr,
+                    )
+                except exceptions.GoogleAPICallError as e:
+                    print(
+                        f"Error creating custom class '{custom_class_id}': {e}",
+                        file=sys.stderr,
+                    )
+                else:
+                    print(f"Created custom class: {response.name}")
+    finally:
+        for client in clients:
+            client.transport.close()
+
+
+# [END speech_v1p1beta1_adaptation_customclasses_create_pooled]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Creates several custom classes in parallel over a "
+        "pool of gRPC connections."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="Your Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--custom_class_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="A comma-separated list of custom class IDs to create (e.g., 'a,b,c').",
+    )
+    parser.add_argument(
+        "--pool_size",
+        type=int,
+        default=4,
+        help="The number of gRPC connections to use (4 to 8 is typical).",
+    )
+
+    args = parser.parse_args()
+
+    create_custom_classes(
+        project_id=args.project_id,
+        custom_class_ids=args.custom_class_ids,
+        pool_size=args.pool_size,
+    )
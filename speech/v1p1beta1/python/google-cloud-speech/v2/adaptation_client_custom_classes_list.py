@@ -12,34 +12,88 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_customclasses_list]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core import retry
 from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v1p1beta1
-
 
-def list_custom_classes(project_id: str) -> None:
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# Retry transient errors quickly and give up after 15 seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.2,
+    maximum=2.0,
+    multiplier=1.3,
+    timeout=15.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+def list_custom_classes(
+    project_id: str,
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
+) -> None:
     """Lists custom classes in a given project and location.
 
     Args:
         project_id: The Google Cloud project ID.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
+    from google.cloud import speech_v1p1beta1
+
     try:
-        client = speech_v1p1beta1.AdaptationClient()
+        if client is None:
+            client = _get_adaptation_client()
 
         parent = client.common_location_path(project_id, location="global")
 
         print(f"Listing custom classes in parent: {parent}")
 
-        page_result = client.list_custom_classes(parent=parent)
+        # Request the largest page the service allows (1000) so that large
+        # projects need as few round trips as possible.
+        request = speech_v1p1beta1.ListCustomClassesRequest(
+            parent=parent, page_size=1000
+        )
+        page_result = client.list_custom_classes(
+            request=request, retry=RETRY_POLICY, timeout=10.0
+        )
 
+        # Write each page of results with one call instead of one print() per
+        # class, without collecting the whole listing first.
         found_classes = False
-        for custom_class in page_result:
-            print(f"Found custom class: {custom_class.name}")
-            found_classes = True
+        for page in page_result.pages:
+            lines = [
+                f"Found custom class: {custom_class.name}\n"
+                for custom_class in page.custom_classes
+            ]
+            if lines:
+                found_classes = True
+                sys.stdout.write("".join(lines))
 
         if not found_classes:
             print(f"No custom classes found in {parent}.")
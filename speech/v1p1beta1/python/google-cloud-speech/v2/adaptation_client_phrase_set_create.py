@@ -12,34 +12,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_phraseset_create]
+import atexit
+import functools
 import sys
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from google.api_core.exceptions import AlreadyExists, GoogleAPICallError
-from google.cloud import speech_v1p1beta1
-from google.cloud.speech_v1p1beta1 import types
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
 
 
-def create_phrase_set(project_id: str, phrase_set_id: str, phrases: list[str]) -> None:
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+def create_phrase_set(
+    project_id: str,
+    phrase_set_id: str,
+    phrases: Sequence[str],
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
+) -> None:
     """Creates a phrase set for Speech-to-Text adaptation.
 
     Args:
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID to use for the phrase set.
-        phrases: A list of strings to include in the phrase set.
+        phrases: The strings to include in the phrase set.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
-    client = speech_v1p1beta1.AdaptationClient()
+    from google.cloud.speech_v1p1beta1 import types
+
+    if client is None:
+        client = _get_adaptation_client()
 
     # Construct the full path for the parent resource.
     parent = client.common_location_path(project_id, location="global")
 
-    # Create PhraseSet.Phrase objects from the input list of strings
-    phrase_set_phrases = [types.PhraseSet.Phrase(value=p) for p in phrases]
-
-    # Construct the PhraseSet object
-    phrase_set = types.PhraseSet(phrases=phrase_set_phrases)
+    # Construct the PhraseSet object and populate its repeated phrases field
+    # in a single extend call, without building an intermediate list.
+    phrase_set = types.PhraseSet()
+    phrase_set.phrases.extend(types.PhraseSet.Phrase(value=p) for p in phrases)
 
     try:
         request = types.CreatePhraseSetRequest(
@@ -86,7 +116,7 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--phrases",
-        type=str,
+        type=lambda value: value.split(","),
         default=["hello world", "goodbye moon"],
         help="Comma-separated list of phrases to include in the phrase set.",
     )
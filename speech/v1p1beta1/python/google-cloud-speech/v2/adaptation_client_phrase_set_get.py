@@ -12,18 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_phraseset_get]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core import retry
 from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1p1beta1
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# Retry transient errors quickly and give up after 15 seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.2,
+    maximum=2.0,
+    multiplier=1.3,
+    timeout=15.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _phrase_set_path(project_id: str, phrase_set_id: str) -> str:
+    """Returns the resource name of a phrase set in the global location."""
+    return f"projects/{project_id}/locations/global/phraseSets/{phrase_set_id}"
 
 
 def get_phrase_set_sample(
     project_id: str,
     phrase_set_id: str,
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
 ) -> None:
     """
     Retrieves a specific phrase set from the Google Cloud Speech-to-Text API.
@@ -31,23 +69,32 @@ def get_phrase_set_sample(
     Args:
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID of the phrase set to retrieve.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
-    client = speech_v1p1beta1.AdaptationClient()
+    if client is None:
+        client = _get_adaptation_client()
 
     # Construct the full resource name for the phrase set.
-    phrase_set_name = client.phrase_set_path(
-        project_id, location="global", phrase_set=phrase_set_id
-    )
+    phrase_set_name = _phrase_set_path(project_id, phrase_set_id)
 
     try:
-        phrase_set = client.get_phrase_set(name=phrase_set_name)
+        phrase_set = client.get_phrase_set(
+            name=phrase_set_name, retry=RETRY_POLICY, timeout=10.0
+        )
 
         print(f"Successfully retrieved phrase set: {phrase_set.name}")
         print(f"  Boost: {phrase_set.boost}")
         if phrase_set.phrases:
-            print("  Phrases:")
-            for phrase_item in phrase_set.phrases:
-                print(f"    - Value: '{phrase_item.value}', Boost: {phrase_item.boost}")
+            # Write all phrases with one call instead of one print() each.
+            sys.stdout.write(
+                "  Phrases:\n"
+                + "".join(
+                    f"    - Value: '{phrase_item.value}', Boost: {phrase_item.boost}\n"
+                    for phrase_item in phrase_set.phrases
+                )
+            )
         else:
             print("  No phrases found in this phrase set.")
 
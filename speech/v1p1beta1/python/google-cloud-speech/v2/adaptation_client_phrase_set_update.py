@@ -0,0 +1,277 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v1p1beta1_adaptation_phraseset_update]
+import atexit
+import functools
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import retry
+from google.api_core.exceptions import GoogleAPICallError, NotFound
+from google.protobuf.field_mask_pb2 import FieldMask
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# Retry transient errors quickly and give up after 15 seconds, instead of the
+# default policy's slower backoff and longer deadline. The updates are retried
+# too: each one sets the masked fields to the values it sends, so repeating it
+# leaves the phrase set in the same state.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.2,
+    maximum=2.0,
+    multiplier=1.3,
+    timeout=15.0,
+)
+
+# The update masks never change, so build them once rather than on every call.
+BOOST_MASK = FieldMask(paths=["boost"])
+PHRASES_MASK = FieldMask(paths=["phrases"])
+PHRASES_BOOST_MASK = FieldMask(paths=["phrases", "boost"])
+
+
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _phrase_set_path(project_id: str, phrase_set_id: str) -> str:
+    """Returns the resource name of a phrase set in the global location."""
+    return f"projects/{project_id}/locations/global/phraseSets/{phrase_set_id}"
+
+
+def update_phrase_set_sample(
+    project_id: str,
+    phrase_set_id: str,
+    new_phrase_value: str | None,
+    new_phrase_boost: float,
+    new_phrase_set_boost: float,
+    *,
+    existing_phrase_set: speech_v1p1beta1.PhraseSet | None = None,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
+) -> None:
+    """
+    Adds a phrase to an existing phrase set and sets the phrase set's boost.
+
+    An update replaces the whole phrases field, so adding a phrase needs the
+    current phrases. They are read with get_phrase_set unless the caller
+    already has the phrase set, for example from list_phrase_set, in which case
+    the update is a single round trip. When only the boost changes, the update
+    mask is narrowed to "boost" and no get is needed at all.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_id: The ID of the phrase set to update.
+        new_phrase_value: The phrase to add, or None to only change the boost.
+        new_phrase_boost: The boost to give the new phrase.
+        new_phrase_set_boost: The new boost for the phrase set as a whole.
+        existing_phrase_set: The current phrase set, if the caller has already
+            retrieved it. It is not modified.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
+    """
+    from google.cloud import speech_v1p1beta1
+
+    if client is None:
+        client = _get_adaptation_client()
+
+    phrase_set_name = _phrase_set_path(project_id, phrase_set_id)
+
+    try:
+        if new_phrase_value is None:
+            phrase_set = speech_v1p1beta1.PhraseSet(
+                name=phrase_set_name, boost=new_phrase_set_boost
+            )
+            update_mask = BOOST_MASK
+        else:
+            if existing_phrase_set is None:
+                existing_phrase_set = client.get_phrase_set(
+                    name=phrase_set_name, retry=RETRY_POLICY, timeout=10.0
+                )
+            print(
+                "Current phrases:",
+                ", ".join(phrase.value for phrase in existing_phrase_set.phrases),
+            )
+
+            phrase_set = speech_v1p1beta1.PhraseSet(
+                name=phrase_set_name,
+                phrases=[
+                    *existing_phrase_set.phrases,
+                    {"value": new_phrase_value, "boost": new_phrase_boost},
+                ],
+                boost=new_phrase_set_boost,
+            )
+            update_mask = PHRASES_BOOST_MASK
+
+        response = client.update_phrase_set(
+            phrase_set=phrase_set,
+            update_mask=update_mask,
+            retry=RETRY_POLICY,
+            timeout=10.0,
+        )
+
+        print(f"Successfully updated phrase set: {response.name}")
+        print(
+            "Updated phrases:", ", ".join(phrase.value for phrase in response.phrases)
+        )
+        print(f"Boost: {response.boost}")
+
+    except NotFound:
+        print(
+            f"Error: Phrase set '{phrase_set_name}' not found. "
+            "Please check the project ID, location, and phrase set ID.",
+            file=sys.stderr,
+        )
+    except GoogleAPICallError as e:
+        print(f"Error updating phrase set: {e}", file=sys.stderr)
+
+
+def append_phrases_bulk(
+    project_id: str,
+    phrase_set_id: str,
+    new_phrases: list[tuple[str, float]],
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
+) -> None:
+    """
+    Appends several phrases to an existing phrase set in one update.
+
+    Calling update_phrase_set_sample once per phrase re-reads the growing
+    phrase list on every call. This reads the phrase set once, appends all of
+    the new phrases locally, and sends a single update.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_id: The ID of the phrase set to update.
+        new_phrases: (value, boost) pairs, one for each phrase to append.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
+    """
+    from google.cloud import speech_v1p1beta1
+
+    if client is None:
+        client = _get_adaptation_client()
+
+    phrase_set_name = _phrase_set_path(project_id, phrase_set_id)
+
+    try:
+        existing_phrase_set = client.get_phrase_set(
+            name=phrase_set_name, retry=RETRY_POLICY, timeout=10.0
+        )
+
+        phrase_set = speech_v1p1beta1.PhraseSet(
+            name=phrase_set_name,
+            phrases=[
+                *existing_phrase_set.phrases,
+                *({"value": value, "boost": boost} for value, boost in new_phrases),
+            ],
+        )
+        response = client.update_phrase_set(
+            phrase_set=phrase_set,
+            update_mask=PHRASES_MASK,
+            retry=RETRY_POLICY,
+            timeout=10.0,
+        )
+
+        print(f"Appended {len(new_phrases)} phrases to phrase set: {response.name}")
+        print(f"The phrase set now has {len(response.phrases)} phrases.")
+
+    except NotFound:
+        print(
+            f"Error: Phrase set '{phrase_set_name}' not found. "
+            "Please check the project ID, location, and phrase set ID.",
+            file=sys.stderr,
+        )
+    except GoogleAPICallError as e:
+        print(f"Error updating phrase set: {e}", file=sys.stderr)
+
+
+# [END speech_v1p1beta1_adaptation_phraseset_update]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Updates a phrase set in Google Cloud Speech-to-Text."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="Your Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--phrase_set_id",
+        type=str,
+        required=True,
+        help="The ID of the phrase set to update.",
+    )
+    parser.add_argument(
+        "--new_phrase_value",
+        type=str,
+        default=None,
+        help="A phrase to add. If omitted, only the phrase set's boost is updated.",
+    )
+    parser.add_argument(
+        "--bulk_phrases",
+        type=lambda value: value.split(","),
+        default=None,
+        help="A comma-separated list of phrases to append in a single update, "
+        "each with --new_phrase_boost (e.g., 'a,b,c'). Takes the place of "
+        "--new_phrase_value.",
+    )
+    parser.add_argument(
+        "--new_phrase_boost",
+        type=float,
+        default=10.0,
+        help="The boost to give the new phrase.",
+    )
+    parser.add_argument(
+        "--new_phrase_set_boost",
+        type=float,
+        default=5.0,
+        help="The new boost for the phrase set.",
+    )
+
+    args = parser.parse_args()
+
+    if args.bulk_phrases:
+        append_phrases_bulk(
+            args.project_id,
+            args.phrase_set_id,
+            [(phrase, args.new_phrase_boost) for phrase in args.bulk_phrases],
+        )
+    else:
+        update_phrase_set_sample(
+            args.project_id,
+            args.phrase_set_id,
+            args.new_phrase_value,
+            args.new_phrase_boost,
+            args.new_phrase_set_boost,
+        )
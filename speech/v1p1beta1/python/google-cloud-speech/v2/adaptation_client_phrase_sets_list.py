@@ -12,17 +12,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v1p1beta1_adaptation_phraseset_list]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core import retry
 from google.api_core.exceptions import NotFound
-from google.cloud import speech_v1p1beta1
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v1p1beta1
+
+# Retry transient errors quickly and give up after 15 seconds, instead of the
+# default policy's slower backoff and longer deadline.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=0.2,
+    maximum=2.0,
+    multiplier=1.3,
+    timeout=15.0,
+)
+
+
+@functools.cache
+def _get_adaptation_client() -> speech_v1p1beta1.AdaptationClient:
+    """Returns an AdaptationClient that is reused for every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v1p1beta1
+
+    client = speech_v1p1beta1.AdaptationClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def list_phrase_sets(
     project_id: str,
+    *,
+    client: speech_v1p1beta1.AdaptationClient | None = None,
 ) -> None:
     """
     Lists phrase sets in a given location.
@@ -32,20 +64,35 @@ def list_phrase_sets(
 
     Args:
         project_id: The Google Cloud project ID.
+        client: An AdaptationClient to send the request with. Pass the same
+            client to several samples to reuse its gRPC channel. If omitted, a
+            client shared by every call in this process is used.
     """
-    client = speech_v1p1beta1.AdaptationClient()
+    from google.cloud import speech_v1p1beta1
+
+    if client is None:
+        client = _get_adaptation_client()
 
     # Construct the full location path
     parent = client.common_location_path(project_id, location="global")
 
     try:
-        page_result = client.list_phrase_set(parent=parent)
+        # Request the largest page the service allows (1000) so that large
+        # projects need as few round trips as possible.
+        request = speech_v1p1beta1.ListPhraseSetRequest(parent=parent, page_size=1000)
+        page_result = client.list_phrase_set(
+            request=request, retry=RETRY_POLICY, timeout=10.0
+        )
 
         print(f"Phrase Sets in {parent}:")
+        # Write each page of results with one call instead of one print() per
+        # set, without collecting the whole listing first.
         found_phrase_sets = False
-        for phrase_set in page_result:
-            found_phrase_sets = True
-            print(f"- {phrase_set.name}")
+        for page in page_result.pages:
+            lines = [f"- {phrase_set.name}\n" for phrase_set in page.phrase_sets]
+            if lines:
+                found_phrase_sets = True
+                sys.stdout.write("".join(lines))
 
         if not found_phrase_sets:
             print("No phrase sets found.")
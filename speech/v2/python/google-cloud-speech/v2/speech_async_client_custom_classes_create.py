@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v2_speech_customclasses_create_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# The maximum number of create operations in flight at once.
+MAX_CONCURRENT_CREATES = 16
+
+
+async def create_custom_class_async(
+    client: speech_v2.SpeechAsyncClient,
+    project_id: str,
+    custom_class_id: str,
+    semaphore: asyncio.Semaphore,
+) -> speech_v2.CustomClass:
+    """Creates one CustomClass and waits for its long-running operation.
+
+    Args:
+        client: The SpeechAsyncClient to send the request with.
+        project_id: The Google Cloud project ID.
+        custom_class_id: The ID to use for the CustomClass.
+        semaphore: Bounds the number of creates in flight at once.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    request = speech_v2.CreateCustomClassRequest(
+        parent=f"projects/{project_id}/locations/global",
+        custom_class=speech_v2.CustomClass(
+            display_name="My Company Names",
+            items=[{"value": "Google"}, {"value": "Alphabet"}, {"value": "DeepMind"}],
+        ),
+        custom_class_id=custom_class_id,
+    )
+    async with semaphore:
+        operation = await client.create_custom_class(request=request)
+        return await operation.result()
+
+
+async def create_custom_classes(
+    project_id: str,
+    custom_class_ids: list[str],
+) -> None:
+    """Creates several CustomClasses concurrently.
+
+    Each create is a long-running operation. Waiting for them one at a time
+    makes the total time the sum of every operation. Sharing one
+    SpeechAsyncClient and awaiting them together makes it close to that of the
+    slowest one.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        custom_class_ids: The IDs to use for the new CustomClasses.
+    """
+    from google.cloud import speech_v2
+
+    client = speech_v2.SpeechAsyncClient()
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CREATES)
+    try:
+        # return_exceptions=True keeps one failed create from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(
+                create_custom_class_async(
+                    client, project_id, custom_class_id, semaphore
+                )
+                for custom_class_id in custom_class_ids
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for custom_class_id, result in zip(custom_class_ids, results):
+        if isinstance(result, exceptions.AlreadyExists):
+            print(
+                f"Custom class '{custom_class_id}' already exists in project "
+                f"'{project_id}'.",
+                file=sys.stderr,
+            )
+        elif isinstance(result, exceptions.GoogleAPICallError):
+            print(
+                f"Error creating custom class '{custom_class_id}': {result}",
+                file=sys.stderr,
+            )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Successfully created custom class: {result.name}")
+
+
+# [END speech_v2_speech_customclasses_create_async]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Creates several CustomClasses concurrently."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--custom_class_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="A comma-separated list of CustomClass IDs to create (e.g., 'a,b,c').",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        create_custom_classes(
+            project_id=args.project_id, custom_class_ids=args.custom_class_ids
+        )
+    )
@@ -0,0 +1,148 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v2_speech_phrasesets_get_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+from google.api_core.client_options import ClientOptions
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# The maximum number of get requests in flight at once.
+MAX_CONCURRENT_GETS = 16
+
+
+async def get_phrase_set_async(
+    client: speech_v2.SpeechAsyncClient,
+    name: str,
+    semaphore: asyncio.Semaphore,
+) -> speech_v2.PhraseSet:
+    """Retrieves one PhraseSet once a request slot is free.
+
+    Args:
+        client: The SpeechAsyncClient to send the request with.
+        name: The resource name of the PhraseSet.
+        semaphore: Bounds the number of gets in flight at once.
+    """
+    async with semaphore:
+        return await client.get_phrase_set(name=name)
+
+
+async def get_phrase_sets(
+    project_id: str,
+    phrase_set_ids: list[str],
+    location: str = "global",
+) -> None:
+    """Retrieves several PhraseSets concurrently.
+
+    Getting them one at a time makes the total time the sum of every round
+    trip. Sharing one SpeechAsyncClient and awaiting the requests together
+    multiplexes them over a single connection, so the total is close to that
+    of the slowest one.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_ids: The IDs of the PhraseSets to retrieve.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechAsyncClient(client_options=client_options)
+
+    names = [
+        f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}"
+        for phrase_set_id in phrase_set_ids
+    ]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GETS)
+    try:
+        # return_exceptions=True keeps one failed lookup from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(get_phrase_set_async(client, name, semaphore) for name in names),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for phrase_set_id, result in zip(phrase_set_ids, results):
+        if isinstance(result, exceptions.NotFound):
+            print(f"Error: PhraseSet '{phrase_set_id}' not found.", file=sys.stderr)
+        elif isinstance(result, exceptions.GoogleAPICallError):
+            print(
+                f"Error retrieving PhraseSet '{phrase_set_id}': {result}",
+                file=sys.stderr,
+            )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            # Look the fields up on the raw message once, rather than through
+            # proto-plus on every access.
+            raw_phrase_set = speech_v2.PhraseSet.pb(result)
+            sys.stdout.write(
+                f"PhraseSet: {raw_phrase_set.name}\n"
+                f"  Display Name: {raw_phrase_set.display_name}\n"
+                f"  Phrases: {len(raw_phrase_set.phrases)}\n"
+                f"  State: {result.state.name}\n"
+            )
+
+
+# [END speech_v2_speech_phrasesets_get_async]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Retrieves several PhraseSets concurrently."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--phrase_set_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="A comma-separated list of PhraseSet IDs to retrieve (e.g., 'a,b,c').",
+    )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        get_phrase_sets(
+            project_id=args.project_id,
+            phrase_set_ids=args.phrase_set_ids,
+            location=args.location,
+        )
+    )
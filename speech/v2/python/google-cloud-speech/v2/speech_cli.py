@@ -0,0 +1,263 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs any of the Speech-to-Text V2 samples in this directory from one entry point.
+
+Each sample file stays self-contained so it can be embedded in the
+documentation. This module only dispatches to them, which lets a test harness
+exercise every sample from a single Python process instead of starting one
+interpreter (and building one parser and client) per sample.
+
+Example:
+    python speech_cli.py config get --project_id my-project
+    python speech_cli.py custom-class create --project_id my-project \\
+        --custom_class_ids class-a class-b
+"""
+
+import argparse
+
+from speech_client_config_get import get_speech_config
+from speech_client_custom_class_create import (
+    bulk_create_custom_classes,
+    create_custom_class,
+)
+from speech_client_custom_class_delete import delete_custom_class
+from speech_client_custom_class_get import get_custom_class
+from speech_client_custom_class_update import update_custom_class
+from speech_client_custom_classes_list import list_custom_classes
+from speech_client_phrase_set_create import create_phrase_set
+from speech_client_phrase_set_delete import delete_phrase_set
+from speech_client_phrase_set_get import get_phrase_set
+from speech_client_phrase_set_update import update_phrase_set
+from speech_client_phrase_sets_list import list_phrase_sets
+
+
+def _add_project_id(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--project_id",
+        required=True,
+        type=str,
+        help="The Google Cloud project ID.",
+    )
+
+
+def _add_location(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'.",
+    )
+
+
+def _add_custom_class_id(parser: argparse.ArgumentParser, help: str) -> None:
+    parser.add_argument("--custom_class_id", required=True, type=str, help=help)
+
+
+def _add_phrase_set_id(parser: argparse.ArgumentParser, help: str) -> None:
+    parser.add_argument("--phrase_set_id", required=True, type=str, help=help)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run a Speech-to-Text V2 sample.")
+    resources = parser.add_subparsers(dest="resource", required=True)
+
+    config = resources.add_parser("config", help="Config samples.")
+    config_commands = config.add_subparsers(dest="command", required=True)
+
+    get_config_parser = config_commands.add_parser(
+        "get", help="Retrieve the project's config."
+    )
+    _add_project_id(get_config_parser)
+    _add_location(get_config_parser)
+    get_config_parser.set_defaults(
+        run=lambda args: get_speech_config(args.project_id, args.location)
+    )
+
+    custom_class = resources.add_parser("custom-class", help="CustomClass samples.")
+    custom_class_commands = custom_class.add_subparsers(dest="command", required=True)
+
+    create_custom_class_parser = custom_class_commands.add_parser(
+        "create", help="Create custom classes."
+    )
+    _add_project_id(create_custom_class_parser)
+    _add_location(create_custom_class_parser)
+    create_custom_class_parser.add_argument(
+        "--custom_class_ids",
+        required=True,
+        nargs="+",
+        type=str,
+        help="The IDs to use for the new custom classes. More than one ID "
+        "creates them in parallel over the shared client.",
+    )
+    create_custom_class_parser.set_defaults(run=_create_custom_classes)
+
+    delete_custom_class_parser = custom_class_commands.add_parser(
+        "delete", help="Delete a custom class."
+    )
+    _add_project_id(delete_custom_class_parser)
+    _add_location(delete_custom_class_parser)
+    _add_custom_class_id(
+        delete_custom_class_parser, "The ID of the custom class to delete."
+    )
+    delete_custom_class_parser.set_defaults(
+        run=lambda args: delete_custom_class(
+            args.project_id, args.custom_class_id, args.location
+        )
+    )
+
+    get_custom_class_parser = custom_class_commands.add_parser(
+        "get", help="Retrieve a custom class."
+    )
+    _add_project_id(get_custom_class_parser)
+    _add_location(get_custom_class_parser)
+    _add_custom_class_id(
+        get_custom_class_parser, "The ID of the custom class to retrieve."
+    )
+    get_custom_class_parser.set_defaults(
+        run=lambda args: get_custom_class(
+            args.project_id, args.custom_class_id, args.location
+        )
+    )
+
+    update_custom_class_parser = custom_class_commands.add_parser(
+        "update", help="Update a custom class."
+    )
+    _add_project_id(update_custom_class_parser)
+    _add_location(update_custom_class_parser)
+    _add_custom_class_id(
+        update_custom_class_parser, "The ID of the custom class to update."
+    )
+    update_custom_class_parser.set_defaults(
+        run=lambda args: update_custom_class(
+            args.project_id, args.custom_class_id, args.location
+        )
+    )
+
+    list_custom_classes_parser = custom_class_commands.add_parser(
+        "list", help="List custom classes."
+    )
+    _add_project_id(list_custom_classes_parser)
+    _add_location(list_custom_classes_parser)
+    list_custom_classes_parser.set_defaults(
+        run=lambda args: list_custom_classes(args.project_id, args.location)
+    )
+
+    phrase_set = resources.add_parser("phrase-set", help="PhraseSet samples.")
+    phrase_set_commands = phrase_set.add_subparsers(dest="command", required=True)
+
+    create_phrase_set_parser = phrase_set_commands.add_parser(
+        "create", help="Create a phrase set."
+    )
+    _add_project_id(create_phrase_set_parser)
+    _add_location(create_phrase_set_parser)
+    _add_phrase_set_id(create_phrase_set_parser, "The ID to use for the phrase set.")
+    create_phrase_set_parser.set_defaults(
+        run=lambda args: create_phrase_set(
+            args.project_id, args.phrase_set_id, args.location
+        )
+    )
+
+    delete_phrase_set_parser = phrase_set_commands.add_parser(
+        "delete", help="Delete a phrase set."
+    )
+    _add_project_id(delete_phrase_set_parser)
+    _add_location(delete_phrase_set_parser)
+    _add_phrase_set_id(delete_phrase_set_parser, "The ID of the phrase set to delete.")
+    delete_phrase_set_parser.set_defaults(
+        run=lambda args: delete_phrase_set(
+            args.project_id, args.phrase_set_id, args.location
+        )
+    )
+
+    get_phrase_set_parser = phrase_set_commands.add_parser(
+        "get", help="Retrieve a phrase set."
+    )
+    _add_project_id(get_phrase_set_parser)
+    _add_location(get_phrase_set_parser)
+    _add_phrase_set_id(get_phrase_set_parser, "The ID of the phrase set to retrieve.")
+    get_phrase_set_parser.set_defaults(
+        run=lambda args: get_phrase_set(
+            args.project_id, args.phrase_set_id, args.location
+        )
+    )
+
+    update_phrase_set_parser = phrase_set_commands.add_parser(
+        "update", help="Update a phrase set."
+    )
+    _add_project_id(update_phrase_set_parser)
+    _add_location(update_phrase_set_parser)
+    _add_phrase_set_id(update_phrase_set_parser, "The ID of the phrase set to update.")
+    update_phrase_set_parser.add_argument(
+        "--new_display_name",
+        required=True,
+        type=str,
+        help="The new display name for the phrase set.",
+    )
+    update_phrase_set_parser.add_argument(
+        "--new_phrase_values",
+        required=True,
+        nargs="+",
+        type=str,
+        help="The phrases for the phrase set, which replace its existing phrases.",
+    )
+    update_phrase_set_parser.add_argument(
+        "--new_phrase_boost",
+        type=float,
+        default=15.0,
+        help="The boost to give each of the new phrases.",
+    )
+    update_phrase_set_parser.add_argument(
+        "--poll_initial",
+        type=float,
+        default=0.2,
+        help="Seconds to wait before first checking whether the update has "
+        "finished.",
+    )
+    update_phrase_set_parser.set_defaults(
+        run=lambda args: update_phrase_set(
+            args.project_id,
+            args.phrase_set_id,
+            args.new_display_name,
+            [(phrase, args.new_phrase_boost) for phrase in args.new_phrase_values],
+            args.poll_initial,
+            args.location,
+        )
+    )
+
+    list_phrase_sets_parser = phrase_set_commands.add_parser(
+        "list", help="List phrase sets."
+    )
+    _add_project_id(list_phrase_sets_parser)
+    _add_location(list_phrase_sets_parser)
+    list_phrase_sets_parser.set_defaults(
+        run=lambda args: list_phrase_sets(args.project_id, args.location)
+    )
+
+    return parser
+
+
+def _create_custom_classes(args: argparse.Namespace) -> None:
+    if len(args.custom_class_ids) == 1:
+        create_custom_class(args.project_id, args.custom_class_ids[0], args.location)
+    else:
+        bulk_create_custom_classes(
+            args.project_id, args.custom_class_ids, args.location
+        )
+
+
+if __name__ == "__main__":
+    args = _build_parser().parse_args()
+
+    args.run(args)
@@ -12,16 +12,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_config_get]
+import atexit
+import functools
 import sys
+import time
+from typing import TYPE_CHECKING
 
 from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v2
 
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# Channel options for the shared client:
+# - No limit on message size, matching the transport's default channel, which
+#   these options replace.
+# - Keepalive pings detect a dropped connection while the shared client sits
+#   idle, so the next call reconnects up front instead of stalling on a dead
+#   socket.
+CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 60000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# How long a fetched config is reused before it is fetched again.
+CACHE_TTL_SECONDS = 60.0
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+    from google.cloud.speech_v2.services.speech.transports import (
+        SpeechGrpcTransport,
+    )
+
+    host = "speech.googleapis.com"
+    if location != "global":
+        host = f"{location}-speech.googleapis.com"
+    channel = SpeechGrpcTransport.create_channel(host, options=CHANNEL_OPTIONS)
+    client = speech_v2.SpeechClient(
+        transport=SpeechGrpcTransport(host=host, channel=channel)
+    )
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=128)
+def _get_config_cached(name: str, location: str, ttl_bucket: int) -> speech_v2.Config:
+    """Returns the config with the given name, fetching it once per ttl_bucket.
 
-def get_speech_config(project_id: str) -> None:
+    ttl_bucket is the current time divided by CACHE_TTL_SECONDS, so a cached
+    config is never more than CACHE_TTL_SECONDS old. Errors are not cached.
+    """
+    return _get_speech_client(location).get_config(name=name)
+
+
+def get_speech_config(project_id: str, location: str = "global") -> None:
     """
     Retrieves the Speech-to-Text API configuration for a given project.
 
@@ -30,21 +86,30 @@ def get_speech_config(project_id: str) -> None:
 
     Args:
         project_id: The Google Cloud project ID.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    from google.cloud import speech_v2
 
     # Construct the full resource name for the config.
-    # For Speech-to-Text V2, the config is a global resource within a project.
-    name = client.config_path(project=project_id, location="global")
+    # For Speech-to-Text V2, there is one config per location within a project.
+    name = f"projects/{project_id}/locations/{location}/config"
 
     try:
-        config = client.get_config(name=name)
+        config = _get_config_cached(
+            name, location, int(time.monotonic() // CACHE_TTL_SECONDS)
+        )
 
-        print(f"Config Name: {config.name}")
+        # Collect the output lines and write them with a single call.
+        lines = [f"Config Name: {config.name}\n"]
         if config.kms_key_name:
-            print(f"KMS Key Name: {config.kms_key_name}")
-        if config.update_time:
-            print(f"Last Updated: {config.update_time.isoformat()}")
+            lines.append(f"KMS Key Name: {config.kms_key_name}\n")
+        # Format the raw Timestamp directly instead of converting it to a
+        # datetime first.
+        raw_config = speech_v2.Config.pb(config)
+        if raw_config.HasField("update_time"):
+            lines.append(f"Last Updated: {raw_config.update_time.ToJsonString()}\n")
+        sys.stdout.write("".join(lines))
 
     except NotFound:
         print(
@@ -58,12 +123,6 @@ def get_speech_config(project_id: str) -> None:
             "Please check your project ID,  and ensure your account has the necessary permissions.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
-        print(
-            "Please review the error message and consult the documentation for further troubleshooting.",
-            file=sys.stderr,
-        )
 
 
 # [END speech_v2_speech_config_get]
@@ -76,7 +135,14 @@ if __name__ == "__main__":
     parser.add_argument(
         "--project_id", type=str, required=True, help="The Google Cloud project ID."
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
-    get_speech_config(args.project_id)
+    get_speech_config(args.project_id, args.location)
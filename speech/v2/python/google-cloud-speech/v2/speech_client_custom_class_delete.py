@@ -12,18 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_customclass_delete]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v2
+from google.api_core.future import polling
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# Poll the long-running operation starting at 0.2 seconds instead of the
+# default 1 second, so short operations are seen to finish sooner, and give up
+# after 2 minutes.
+POLLING_POLICY = polling.DEFAULT_POLLING.with_delay(
+    initial=0.2, maximum=4.0, multiplier=1.5
+).with_timeout(120.0)
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def delete_custom_class(
     project_id: str,
     custom_class_id: str,
+    location: str = "global",
 ) -> None:
     """
     Deletes a custom class.
@@ -31,19 +63,21 @@ def delete_custom_class(
     Args:
         project_id: The Google Cloud project ID.
         custom_class_id: The ID of the custom class to delete.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    client = _get_speech_client(location)
 
     # Construct the full resource name for the custom class.
-    custom_class_name = client.custom_class_path(
-        project=project_id, location="global", custom_class=custom_class_id
+    custom_class_name = (
+        f"projects/{project_id}/locations/{location}/customClasses/{custom_class_id}"
     )
 
     try:
         # Deletes the custom class. The long-running operation returns the
         # CustomClass resource if successful.
         operation = client.delete_custom_class(name=custom_class_name)
-        response = operation.result()
+        response = operation.result(timeout=120.0, polling=POLLING_POLICY)
         print(f"Successfully deleted custom class: {response.name}")
     except NotFound:
         print(f"Custom class {custom_class_id} not found.", file=sys.stderr)
@@ -70,10 +104,18 @@ if __name__ == "__main__":
         required=True,
         help="The ID of the custom class to delete.",
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
     delete_custom_class(
         project_id=args.project_id,
         custom_class_id=args.custom_class_id,
+        location=args.location,
     )
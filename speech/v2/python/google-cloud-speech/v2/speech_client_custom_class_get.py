@@ -12,18 +12,59 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_customclass_get]
+import atexit
+import functools
 import sys
+import time
+from typing import TYPE_CHECKING
 
+from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v2
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# How long a fetched custom class is reused before it is fetched again.
+CACHE_TTL_SECONDS = 60.0
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=128)
+def _get_custom_class_cached(
+    name: str, location: str, ttl_bucket: int
+) -> speech_v2.CustomClass:
+    """Returns the custom class with the given name, fetching it once per ttl_bucket.
+
+    ttl_bucket is the current time divided by CACHE_TTL_SECONDS, so a cached
+    custom class is never more than CACHE_TTL_SECONDS old. Errors, including
+    NotFound, are not cached.
+    """
+    return _get_speech_client(location).get_custom_class(name=name)
 
 
 def get_custom_class(
     project_id: str,
     custom_class_id: str,
+    location: str = "global",
 ) -> None:
     """
     Retrieves a specific CustomClass.
@@ -35,26 +76,36 @@ def get_custom_class(
         project_id: The Google Cloud project ID.
         custom_class_id: The ID of the custom class to retrieve.
                           Example: "my-custom-class-123"
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    from google.cloud import speech_v2
 
     # Construct the full resource name for the custom class.
-    custom_class_name = client.custom_class_path(
-        project=project_id, location="global", custom_class=custom_class_id
+    custom_class_name = (
+        f"projects/{project_id}/locations/{location}/customClasses/{custom_class_id}"
     )
 
     try:
-        custom_class = client.get_custom_class(name=custom_class_name)
-
-        print(f"Successfully retrieved custom class: {custom_class.name}")
-        print(f"Display Name: {custom_class.display_name}")
-        print(f"State: {custom_class.state.name}")
-        if custom_class.items:
-            print("Class Items:")
-            for item in custom_class.items:
-                print(f"  - {item.value}")
+        custom_class = _get_custom_class_cached(
+            custom_class_name, location, int(time.monotonic() // CACHE_TTL_SECONDS)
+        )
+
+        # Read the items once from the raw protobuf message, which skips
+        # wrapping each one in a proto-plus message.
+        class_items = speech_v2.CustomClass.pb(custom_class).items
+        if class_items:
+            items = "Class Items:\n" + "".join(
+                f"  - {item.value}\n" for item in class_items
+            )
         else:
-            print("No class items defined.")
+            items = "No class items defined.\n"
+        # Write the result with a single call instead of one print() per line.
+        sys.stdout.write(
+            f"Successfully retrieved custom class: {custom_class.name}\n"
+            f"Display Name: {custom_class.display_name}\n"
+            f"State: {custom_class.state.name}\n" + items
+        )
 
     except NotFound:
         print(f"Error: Custom class '{custom_class_name}' not found.", file=sys.stderr)
@@ -66,12 +117,6 @@ def get_custom_class(
     except GoogleAPICallError as e:
         print(f"An API error occurred: {e}", file=sys.stderr)
         print("Please check your project ID and custom class ID.", file=sys.stderr)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
-        print(
-            "Please review the error message and your environment setup.",
-            file=sys.stderr,
-        )
 
 
 # [END speech_v2_speech_customclass_get]
@@ -93,7 +138,14 @@ if __name__ == "__main__":
         required=True,
         help="The ID of the custom class to retrieve.",
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
-    get_custom_class(args.project_id, args.custom_class_id)
+    get_custom_class(args.project_id, args.custom_class_id, args.location)
@@ -12,19 +12,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_customclass_update]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v2
-from google.protobuf import field_mask_pb2
+from google.api_core.future import polling
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+    from google.protobuf import field_mask_pb2
+
+# Poll the long-running operation starting at 0.2 seconds instead of the
+# default 1 second, so short operations are seen to finish sooner, and give up
+# after 2 minutes.
+POLLING_POLICY = polling.DEFAULT_POLLING.with_delay(
+    initial=0.2, maximum=4.0, multiplier=1.5
+).with_timeout(120.0)
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.cache
+def _field_mask(*paths: str) -> field_mask_pb2.FieldMask:
+    """Returns a FieldMask naming the given fields, built once per set of paths.
+
+    protobuf is imported here rather than at the top of the file, so that
+    parsing arguments does not pay for loading it either.
+    """
+    from google.protobuf import field_mask_pb2
+
+    return field_mask_pb2.FieldMask(paths=list(paths))
 
 
 def update_custom_class(
     project_id: str,
     custom_class_id: str,
+    location: str = "global",
 ) -> None:
     """
     Updates a custom class.
@@ -35,12 +79,16 @@ def update_custom_class(
     Args:
         project_id: The Google Cloud project ID.
         custom_class_id: The ID of the custom class to update.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    from google.cloud import speech_v2
+
+    client = _get_speech_client(location)
 
     # Construct the full resource name for the custom class.
-    custom_class_name = client.custom_class_path(
-        project=project_id, location="global", custom_class=custom_class_id
+    custom_class_name = (
+        f"projects/{project_id}/locations/{location}/customClasses/{custom_class_id}"
     )
 
     # Define the custom class fields to update.
@@ -55,28 +103,29 @@ def update_custom_class(
         ],
     )
 
-    # Create a field mask to specify which fields to update.
-    # Only fields specified in the update_mask will be updated.
-    # To replace the entire resource, use update_mask=field_mask_pb2.FieldMask(paths=["*"]).
-    # To update specific fields, list them like ["display_name", "items"].
-    update_mask = field_mask_pb2.FieldMask(paths=["display_name", "items"])
-
     try:
         # The update_custom_class method returns a long-running operation.
         # We wait for the operation to complete to get the final result.
         operation = client.update_custom_class(
-            custom_class=updated_custom_class, update_mask=update_mask
+            custom_class=updated_custom_class,
+            # Only the fields named in the update mask are updated. To replace
+            # the entire resource, use the path "*" instead.
+            update_mask=_field_mask("display_name", "items"),
         )
         print("Waiting for operation to complete...")
-        response = operation.result()
-
-        print(f"Successfully updated custom class: {response.name}")
-        print(f"Display Name: {response.display_name}")
-        print("Items:")
-        for item in response.items:
-            print(f"- {item.value}")
-        print(f"State: {response.state.name}")
-        print(f"Update Time: {response.update_time.isoformat()}")
+        response = operation.result(timeout=120.0, polling=POLLING_POLICY)
+        raw_response = speech_v2.CustomClass.pb(response)
+
+        # Write the result with a single call instead of one print() per line.
+        sys.stdout.write(
+            f"Successfully updated custom class: {response.name}\n"
+            f"Display Name: {response.display_name}\n"
+            "Items:\n"
+            # The raw message's items skip the proto-plus wrappers.
+            + "".join(f"- {item.value}\n" for item in raw_response.items)
+            + f"State: {response.state.name}\n"
+            f"Update Time: {raw_response.update_time.ToJsonString()}\n"
+        )
 
     except NotFound:
         print(f"Error: Custom class '{custom_class_name}' not found.", file=sys.stderr)
@@ -112,7 +161,14 @@ if __name__ == "__main__":
         required=True,
         help="The ID of the custom class to update.",
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
-    update_custom_class(args.project_id, args.custom_class_id)
+    update_custom_class(args.project_id, args.custom_class_id, args.location)
@@ -12,34 +12,102 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_customclasses_list]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
 from google.api_core import exceptions
-from google.cloud import speech_v2
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# Channel options for the shared client:
+# - No limit on message size, matching the transport's default channel, which
+#   these options replace.
+# - Keepalive pings detect a dropped connection while the client sits idle, so
+#   the next call reconnects up front instead of stalling on a dead socket.
+# - A larger per-stream lookahead lets a large list page arrive without the
+#   sender repeatedly waiting on flow-control window updates.
+CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 60000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.lookahead_bytes", 8 * 1024 * 1024),
+]
+
+# The sample only prints each custom class's name, so ask the service to
+# return just that field (and the token needed to fetch the next page) instead
+# of every field of every custom class.
+FIELD_MASK_METADATA = [("x-goog-fieldmask", "custom_classes.name,next_page_token")]
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+    from google.cloud.speech_v2.services.speech.transports import (
+        SpeechGrpcTransport,
+    )
+
+    host = "speech.googleapis.com"
+    if location != "global":
+        host = f"{location}-speech.googleapis.com"
+    channel = SpeechGrpcTransport.create_channel(host, options=CHANNEL_OPTIONS)
+    client = speech_v2.SpeechClient(
+        transport=SpeechGrpcTransport(host=host, channel=channel)
+    )
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
-def list_custom_classes(project_id: str) -> None:
+def list_custom_classes(project_id: str, location: str = "global") -> None:
     """
     Lists custom classes in a given project.
 
     Args:
         project_id: The Google Cloud project ID.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    from google.cloud import speech_v2
 
-    parent = f"projects/{project_id}/locations/global"
+    client = _get_speech_client(location)
+
+    parent = f"projects/{project_id}/locations/{location}"
 
     try:
         print(f"Listing custom classes in {parent}:")
-        page_result = client.list_custom_classes(parent=parent)
+        # Request the largest page the service allows (1000) so that large
+        # projects need as few round trips as possible.
+        request = speech_v2.ListCustomClassesRequest(parent=parent, page_size=1000)
+        page_result = client.list_custom_classes(
+            request=request, metadata=FIELD_MASK_METADATA
+        )
 
+        # Handle one page (one response message) at a time, writing each with
+        # a single call instead of one print() per custom class. The raw page
+        # yields the raw custom classes, so no proto-plus wrapper is built for
+        # each.
         found_custom_classes = False
-        for custom_class in page_result:
-            found_custom_classes = True
-            print(f"  Found custom class: {custom_class.name}")
+        for page in page_result.pages:
+            raw_page = speech_v2.ListCustomClassesResponse.pb(page)
+            lines = [
+                f"  Found custom class: {custom_class.name}\n"
+                for custom_class in raw_page.custom_classes
+            ]
+            if lines:
+                found_custom_classes = True
+                sys.stdout.write("".join(lines))
 
         if not found_custom_classes:
             print(f"No custom classes found in {parent}.")
@@ -53,8 +121,8 @@ def list_custom_classes(project_id: str) -> None:
             "Please ensure the project ID is correct and that the Speech-to-Text API is enabled.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except exceptions.GoogleAPICallError as e:
+        print(f"Error listing custom classes: {e}", file=sys.stderr)
 
 
 # [END speech_v2_speech_customclasses_list]
@@ -69,7 +137,14 @@ if __name__ == "__main__":
         required=True,
         help="The Google Cloud project ID.",
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
-    list_custom_classes(args.project_id)
+    list_custom_classes(args.project_id, args.location)
@@ -12,18 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_phraseset_delete]
+import atexit
+import functools
 import sys
+from typing import TYPE_CHECKING
 
 from google.api_core import exceptions
-from google.cloud import speech_v2
+from google.api_core.client_options import ClientOptions
+from google.api_core.future import polling
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# Poll the long-running operation starting at 0.2 seconds instead of the
+# default 1 second, so short operations are seen to finish sooner, and give up
+# after 2 minutes.
+POLLING_POLICY = polling.DEFAULT_POLLING.with_delay(
+    initial=0.2, maximum=4.0, multiplier=1.5
+).with_timeout(120.0)
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def delete_phrase_set(
     project_id: str,
     phrase_set_id: str,
+    location: str = "global",
 ) -> None:
     """Deletes a PhraseSet from Google Cloud Speech-to-Text.
 
@@ -32,14 +64,18 @@ def delete_phrase_set(
     Args:
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID of the PhraseSet to delete.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    client = _get_speech_client(location)
 
-    phrase_set_name = client.phrase_set_path(project_id, "global", phrase_set_id)
+    phrase_set_name = (
+        f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}"
+    )
 
     try:
         operation = client.delete_phrase_set(name=phrase_set_name)
-        operation.result()
+        operation.result(timeout=120.0, polling=POLLING_POLICY)
 
         print(f"Successfully deleted phrase set: {phrase_set_name}")
 
@@ -49,8 +85,8 @@ def delete_phrase_set(
             "It may have already been deleted or never existed.",
             file=sys.stderr,
         )
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except exceptions.GoogleAPICallError as e:
+        print(f"Error deleting phrase set {phrase_set_name}: {e}", file=sys.stderr)
 
 
 # [END speech_v2_speech_phraseset_delete]
@@ -72,7 +108,14 @@ if __name__ == "__main__":
         required=True,
         help="The ID of the PhraseSet to delete.",
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
-    delete_phrase_set(args.project_id, args.phrase_set_id)
+    delete_phrase_set(args.project_id, args.phrase_set_id, args.location)
@@ -12,43 +12,79 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_phraseset_get]
+import atexit
+import concurrent.futures
+import functools
 import sys
+from typing import TYPE_CHECKING
 
+from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v2
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# The number of get requests get_phrase_sets keeps in flight at once.
+MAX_BATCH_WORKERS = 32
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def get_phrase_set(
     project_id: str,
     phrase_set_id: str,
+    location: str = "global",
 ) -> None:
     """Retrieves a specific PhraseSet resource.
 
     Args:
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID of the PhraseSet to retrieve.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
-    client = speech_v2.SpeechClient()
+    from google.cloud import speech_v2
 
-    name = client.phrase_set_path(
-        project=project_id, location="global", phrase_set=phrase_set_id
-    )
+    client = _get_speech_client(location)
+
+    name = f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}"
 
     try:
         request = speech_v2.GetPhraseSetRequest(name=name)
         phrase_set = client.get_phrase_set(request=request)
 
-        print(f"Display Name: {phrase_set.display_name}")
-        if phrase_set.phrases:
-            print("Phrases:")
-            for phrase in phrase_set.phrases:
-                print(f"  - {phrase.value} (Boost: {phrase.boost})")
+        # Read the phrases from the underlying protobuf message, which gives
+        # direct field access without a proto-plus wrapper for each phrase.
+        raw_phrase_set = speech_v2.PhraseSet.pb(phrase_set)
+        lines = [f"Display Name: {raw_phrase_set.display_name}\n"]
+        if raw_phrase_set.phrases:
+            lines.append("Phrases:\n")
+            lines.extend(
+                f"  - {phrase.value} (Boost: {phrase.boost})\n"
+                for phrase in raw_phrase_set.phrases
+            )
         else:
-            print("No phrases defined in this PhraseSet.")
-        print(f"State: {phrase_set.state.name}")
+            lines.append("No phrases defined in this PhraseSet.\n")
+        lines.append(f"State: {phrase_set.state.name}\n")
+        sys.stdout.write("".join(lines))
 
     except NotFound:
         print(f"Error: PhraseSet '{phrase_set_id}' not found.", file=sys.stderr)
@@ -65,6 +101,52 @@ def get_phrase_set(
         )
 
 
+def get_phrase_sets(
+    project_id: str,
+    phrase_set_ids: list[str],
+    location: str = "global",
+) -> list[speech_v2.PhraseSet]:
+    """Retrieves several PhraseSets in parallel over the shared client.
+
+    Getting them one at a time costs one round trip each. gRPC releases the
+    GIL while a call waits on the network, so running the gets on a thread
+    pool overlaps them on the shared client's single connection.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_ids: The IDs of the PhraseSets to retrieve.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+
+    Returns:
+        The PhraseSets that were found, in the order of phrase_set_ids.
+    """
+    client = _get_speech_client(location)
+    parent = f"projects/{project_id}/locations/{location}"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS) as pool:
+        futures = [
+            pool.submit(
+                client.get_phrase_set,
+                name=f"{parent}/phraseSets/{phrase_set_id}",
+            )
+            for phrase_set_id in phrase_set_ids
+        ]
+
+    phrase_sets = []
+    for phrase_set_id, future in zip(phrase_set_ids, futures):
+        try:
+            phrase_set = future.result()
+        except NotFound:
+            print(f"Error: PhraseSet '{phrase_set_id}' not found.", file=sys.stderr)
+        except GoogleAPICallError as e:
+            print(f"Error retrieving PhraseSet '{phrase_set_id}': {e}", file=sys.stderr)
+        else:
+            phrase_sets.append(phrase_set)
+            print(f"Retrieved PhraseSet: {phrase_set.name}")
+    return phrase_sets
+
+
 # [END speech_v2_speech_phraseset_get]
 
 if __name__ == "__main__":
@@ -77,13 +159,29 @@ if __name__ == "__main__":
         required=True,
         help="The Google Cloud project ID.",
     )
-    parser.add_argument(
+    ids_group = parser.add_mutually_exclusive_group(required=True)
+    ids_group.add_argument(
         "--phrase_set_id",
         type=str,
-        required=True,
         help="The ID of the PhraseSet to retrieve.",
     )
+    ids_group.add_argument(
+        "--phrase_set_ids",
+        type=lambda value: value.split(","),
+        help="A comma-separated list of PhraseSet IDs to retrieve in parallel "
+        "(e.g., 'a,b,c').",
+    )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
 
     args = parser.parse_args()
 
-    get_phrase_set(args.project_id, args.phrase_set_id)
+    if args.phrase_set_ids:
+        get_phrase_sets(args.project_id, args.phrase_set_ids, args.location)
+    else:
+        get_phrase_set(args.project_id, args.phrase_set_id, args.location)
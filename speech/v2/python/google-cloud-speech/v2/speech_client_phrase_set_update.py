@@ -12,70 +12,189 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_phraseset_update]
+import atexit
+import concurrent.futures
+import functools
 import sys
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
 
-from google.api_core.exceptions import GoogleAPICallError, NotFound
-from google.cloud import speech_v2
-from google.protobuf import field_mask_pb2
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import (
+    Aborted,
+    GoogleAPICallError,
+    GoogleAPIError,
+    NotFound,
+)
+from google.api_core.future import polling
 
+if TYPE_CHECKING:
+    from google.api_core.operation import Operation
+    from google.cloud import speech_v2
+    from google.protobuf import field_mask_pb2
 
-def update_phrase_set(
+# Poll the long-running operation starting at 0.2 seconds instead of the
+# default 1 second, so short operations are seen to finish sooner, and give up
+# after 2 minutes. The delay grows by half after each poll, so long operations
+# are not polled more often than needed. The functions below take a
+# poll_initial argument to change the first delay.
+POLLING_POLICY = polling.DEFAULT_POLLING.with_delay(
+    initial=0.2, maximum=4.0, multiplier=1.5
+).with_timeout(120.0)
+
+
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.cache
+def _field_mask(*paths: str) -> field_mask_pb2.FieldMask:
+    """Returns a FieldMask naming the given fields, built once per set of paths.
+
+    protobuf is imported here rather than at the top of the file, so that
+    parsing arguments does not pay for loading it either.
+    """
+    from google.protobuf import field_mask_pb2
+
+    return field_mask_pb2.FieldMask(paths=list(paths))
+
+
+def start_phrase_set_update(
     project_id: str,
     phrase_set_id: str,
     new_display_name: str,
-    new_phrase_value: str,
-) -> None:
-    """Updates an existing PhraseSet with a new display name and phrases.
+    new_phrase_values: Iterable[tuple[str, float]],
+    location: str = "global",
+) -> Operation:
+    """Sends the update for a PhraseSet and returns without waiting for it.
 
     Args:
         project_id: The Google Cloud project ID.
         phrase_set_id: The ID of the PhraseSet to update.
         new_display_name: The new display name for the PhraseSet.
-        new_phrase_value: A new phrase value to include in the PhraseSet.
+        new_phrase_values: (value, boost) pairs, one for each phrase the
+            PhraseSet should contain.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+
+    Returns:
+        The long-running operation for the update. Pass it to wait_all, or
+        call its result() method, to wait for the update to finish.
     """
-    client = speech_v2.SpeechClient()
+    from google.cloud import speech_v2
 
-    phrase_set_name = client.phrase_set_path(
-        project=project_id, location="global", phrase_set=phrase_set_id
-    )
+    client = _get_speech_client(location)
 
     # Create a PhraseSet object with the desired updates.
     # Only fields specified in the update_mask will be updated.
     # Note: Providing a list of phrases here will REPLACE any existing phrases
     # in the PhraseSet if 'phrases' is included in the update_mask.
-    # To append to existing phrases, you would first need to retrieve the
-    # current PhraseSet using client.get_phrase_set, modify its phrases list,
-    # and then send the updated PhraseSet.
+    # To add to the existing phrases instead, use append_phrases below.
     updated_phrase_set = speech_v2.PhraseSet(
-        name=phrase_set_name,
+        name=f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}",
         display_name=new_display_name,
-        phrases=[
-            speech_v2.PhraseSet.Phrase(value=new_phrase_value, boost=15.0),
-            speech_v2.PhraseSet.Phrase(value="updated term", boost=10.0),
-        ],
     )
+    # Add every phrase in a single extend call, so hundreds of phrases do not
+    # each pay for a separate assignment.
+    updated_phrase_set.phrases.extend(
+        speech_v2.PhraseSet.Phrase(value=value, boost=boost)
+        for value, boost in new_phrase_values
+    )
+
+    return client.update_phrase_set(
+        phrase_set=updated_phrase_set,
+        # Update both the display_name and the phrases.
+        update_mask=_field_mask("display_name", "phrases"),
+    )
+
+
+def wait_all(
+    operations: list[Operation], timeout: float = 120.0, poll_initial: float = 0.2
+) -> list[speech_v2.PhraseSet | BaseException]:
+    """Waits for several operations and returns their results in order.
+
+    The operations already run concurrently on the server, so waiting on them
+    in turn takes about as long as the slowest one. timeout bounds the whole
+    wait rather than each operation, so each wait gets only the time left
+    before a single deadline. A failed or timed-out operation's exception is
+    returned in its place rather than raised, so one failure does not hide
+    the results of the rest.
+    """
+    polling_policy = POLLING_POLICY.with_delay(initial=poll_initial)
+    deadline = time.monotonic() + timeout
+    results = []
+    for op in operations:
+        remaining = max(0.0, deadline - time.monotonic())
+        try:
+            results.append(op.result(timeout=remaining, polling=polling_policy))
+        except (GoogleAPIError, concurrent.futures.TimeoutError) as e:
+            results.append(e)
+    return results
+
+
+def update_phrase_set(
+    project_id: str,
+    phrase_set_id: str,
+    new_display_name: str,
+    new_phrase_values: Iterable[tuple[str, float]],
+    poll_initial: float = 0.2,
+    location: str = "global",
+) -> None:
+    """Updates an existing PhraseSet with a new display name and phrases.
 
-    # Create a FieldMask to specify which fields to update.
-    # In this example, we are updating both the display_name and the phrases.
-    update_mask = field_mask_pb2.FieldMask(paths=["display_name", "phrases"])
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_id: The ID of the PhraseSet to update.
+        new_display_name: The new display name for the PhraseSet.
+        new_phrase_values: (value, boost) pairs, one for each phrase the
+            PhraseSet should contain.
+        poll_initial: How long to wait, in seconds, before first checking
+            whether the update has finished.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+    """
+    from google.cloud import speech_v2
+
+    phrase_set_name = (
+        f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}"
+    )
 
     try:
-        operation = client.update_phrase_set(
-            phrase_set=updated_phrase_set, update_mask=update_mask
+        operation = start_phrase_set_update(
+            project_id, phrase_set_id, new_display_name, new_phrase_values, location
         )
 
         print("Waiting for operation to complete for PhraseSet: " f"{phrase_set_name}")
-        response = operation.result()
+        response = operation.result(
+            timeout=120.0, polling=POLLING_POLICY.with_delay(initial=poll_initial)
+        )
 
         print(f"Successfully updated PhraseSet: {response.name}")
         print(f"New Display Name: {response.display_name}")
         print("Updated Phrases:")
         for phrase in response.phrases:
             print(f"  - Value: '{phrase.value}', Boost: {phrase.boost}")
-        print(f"Last updated: {response.update_time.isoformat()}")
+        print(
+            "Last updated: "
+            f"{speech_v2.PhraseSet.pb(response).update_time.ToJsonString()}"
+        )
 
     except NotFound:
         print(
@@ -86,8 +205,128 @@ def update_phrase_set(
     except GoogleAPICallError as e:
         print(f"Google Cloud API Error: {e}", file=sys.stderr)
         print("Please check your project ID and permissions.", file=sys.stderr)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+
+
+def update_phrase_sets(
+    project_id: str,
+    phrase_set_ids: list[str],
+    new_display_name: str,
+    new_phrase_values: Sequence[tuple[str, float]],
+    poll_initial: float = 0.2,
+    location: str = "global",
+) -> None:
+    """Applies the same update to several PhraseSets at once.
+
+    Every update is started before any of them is waited on, so they run
+    concurrently and the total time is close to that of the slowest one
+    rather than the sum of all of them.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_ids: The IDs of the PhraseSets to update.
+        new_display_name: The new display name for the PhraseSets.
+        new_phrase_values: (value, boost) pairs, one for each phrase the
+            PhraseSets should contain.
+        poll_initial: How long to wait, in seconds, before first checking
+            whether the update has finished.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+    """
+    started_ids = []
+    operations = []
+    for phrase_set_id in phrase_set_ids:
+        try:
+            operations.append(
+                start_phrase_set_update(
+                    project_id,
+                    phrase_set_id,
+                    new_display_name,
+                    new_phrase_values,
+                    location,
+                )
+            )
+            started_ids.append(phrase_set_id)
+        except GoogleAPICallError as e:
+            print(f"Error updating PhraseSet '{phrase_set_id}': {e}", file=sys.stderr)
+
+    for phrase_set_id, result in zip(
+        started_ids, wait_all(operations, poll_initial=poll_initial)
+    ):
+        if isinstance(result, BaseException):
+            print(
+                f"Error updating PhraseSet '{phrase_set_id}': {result}",
+                file=sys.stderr,
+            )
+        else:
+            print(f"Successfully updated PhraseSet: {result.name}")
+
+
+def append_phrases(
+    project_id: str,
+    phrase_set_id: str,
+    new_phrase_values: Iterable[tuple[str, float]],
+    poll_initial: float = 0.2,
+    location: str = "global",
+) -> None:
+    """Adds phrases to an existing PhraseSet, keeping the ones it already has.
+
+    The update depends on the current phrases, so the PhraseSet has to be read
+    before it can be written. The message returned by the get is extended in
+    place and sent straight back, rather than copied into a new PhraseSet, and
+    only the phrases are named in the update mask.
+
+    The fetched PhraseSet carries its etag, which is sent back with the update.
+    If another writer changed the PhraseSet in between, the service rejects
+    the update instead of silently dropping their phrases.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_id: The ID of the PhraseSet to add phrases to.
+        new_phrase_values: (value, boost) pairs, one for each phrase to add.
+        poll_initial: How long to wait, in seconds, before first checking
+            whether the update has finished.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+    """
+    from google.cloud import speech_v2
+
+    client = _get_speech_client(location)
+    phrase_set_name = (
+        f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}"
+    )
+
+    try:
+        phrase_set = client.get_phrase_set(name=phrase_set_name)
+        phrase_set.phrases.extend(
+            speech_v2.PhraseSet.Phrase(value=value, boost=boost)
+            for value, boost in new_phrase_values
+        )
+
+        operation = client.update_phrase_set(
+            phrase_set=phrase_set,
+            # Only the phrases change, so the display name (and every other
+            # field) is left as the service already has it.
+            update_mask=_field_mask("phrases"),
+        )
+        response = operation.result(
+            timeout=120.0, polling=POLLING_POLICY.with_delay(initial=poll_initial)
+        )
+
+        print(
+            f"Successfully updated PhraseSet: {response.name} "
+            f"({len(response.phrases)} phrases)"
+        )
+
+    except NotFound:
+        print(f"Error: PhraseSet '{phrase_set_name}' not found.", file=sys.stderr)
+    except Aborted:
+        print(
+            f"Error: PhraseSet '{phrase_set_name}' was changed by another "
+            "request while phrases were being added. Try again.",
+            file=sys.stderr,
+        )
+    except GoogleAPICallError as e:
+        print(f"Google Cloud API Error: {e}", file=sys.stderr)
 
 
 # [END speech_v2_speech_phraseset_update]
@@ -102,32 +341,87 @@ if __name__ == "__main__":
         required=True,
         help="The Google Cloud project ID.",
     )
-    parser.add_argument(
+    ids_group = parser.add_mutually_exclusive_group(required=True)
+    ids_group.add_argument(
         "--phrase_set_id",
         type=str,
-        required=True,
         help="The ID of the existing PhraseSet to update.",
     )
+    ids_group.add_argument(
+        "--phrase_set_ids",
+        type=lambda value: value.split(","),
+        help="A comma-separated list of PhraseSet IDs to update concurrently "
+        "(e.g., 'a,b,c').",
+    )
     parser.add_argument(
         "--new_display_name",
         type=str,
+        help="The new display name for the PhraseSet. Required unless --append "
+        "is given.",
+    )
+    parser.add_argument(
+        "--new_phrase_values",
+        type=lambda value: value.split(","),
         required=True,
-        help="The new display name for the PhraseSet.",
+        help="A comma-separated list of phrases for the PhraseSet, which "
+        "replace its existing phrases (e.g., 'a,b,c').",
+    )
+    parser.add_argument(
+        "--new_phrase_boost",
+        type=float,
+        default=15.0,
+        help="The boost to give each of the new phrases.",
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Add the new phrases to the PhraseSet's existing ones instead of "
+        "replacing them. The display name is left unchanged.",
+    )
+    parser.add_argument(
+        "--poll_initial",
+        type=float,
+        default=0.2,
+        help="Seconds to wait before first checking whether the update has "
+        "finished. Later checks back off up to 4 seconds apart.",
     )
     parser.add_argument(
-        "--new_phrase_value",
+        "--location",
         type=str,
-        required=True,
-        help=(
-            "A new phrase to include in the PhraseSet " "(replaces existing phrases)."
-        ),
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
     )
 
     args = parser.parse_args()
 
-    update_phrase_set(
-        args.project_id,
-        args.phrase_set_id,
-        args.new_display_name,
-        args.new_phrase_value,
-    )
+    if args.append:
+        if args.phrase_set_ids:
+            parser.error("--append works on a single --phrase_set_id.")
+        append_phrases(
+            args.project_id,
+            args.phrase_set_id,
+            [(phrase, args.new_phrase_boost) for phrase in args.new_phrase_values],
+            args.poll_initial,
+            args.location,
+        )
+    elif args.new_display_name is None:
+        parser.error("--new_display_name is required unless --append is given.")
+    elif args.phrase_set_ids:
+        update_phrase_sets(
+            args.project_id,
+            args.phrase_set_ids,
+            args.new_display_name,
+            [(phrase, args.new_phrase_boost) for phrase in args.new_phrase_values],
+            args.poll_initial,
+            args.location,
+        )
+    else:
+        update_phrase_set(
+            args.project_id,
+            args.phrase_set_id,
+            args.new_display_name,
+            [(phrase, args.new_phrase_boost) for phrase in args.new_phrase_values],
+            args.poll_initial,
+            args.location,
+        )
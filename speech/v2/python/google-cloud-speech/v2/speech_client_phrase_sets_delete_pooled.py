@@ -0,0 +1,196 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import argparse
+
+# [START speech_v2_speech_phrasesets_delete_pooled]
+import concurrent.futures
+import itertools
+import sys
+from typing import TYPE_CHECKING
+
+from google.api_core import exceptions
+from google.api_core.future import polling
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# Poll each delete operation starting at 0.2 seconds instead of the default
+# 1 second, so short operations are seen to finish sooner, and give up after
+# 2 minutes.
+POLLING_POLICY = polling.DEFAULT_POLLING.with_delay(
+    initial=0.2, maximum=4.0, multiplier=1.5
+).with_timeout(120.0)
+
+
+def _make_pooled_speech_clients(
+    pool_size: int, location: str = "global"
+) -> list[speech_v2.SpeechClient]:
+    """Returns pool_size clients, each with its own gRPC connection.
+
+    By default gRPC shares connections between channels created with the same
+    arguments. Giving each channel a local subchannel pool makes it open its
+    own connection, so concurrent requests are spread over several HTTP/2
+    connections instead of contending for the flow-control window of one.
+    A regional location is served by its own endpoint.
+    """
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+    from google.cloud.speech_v2.services.speech.transports import (
+        SpeechGrpcTransport,
+    )
+
+    host = "speech.googleapis.com"
+    if location != "global":
+        host = f"{location}-speech.googleapis.com"
+
+    clients = []
+    for _ in range(pool_size):
+        # Passing options replaces the transport's defaults, so the unlimited
+        # message sizes of the default channel are set here as well.
+        channel = SpeechGrpcTransport.create_channel(
+            host,
+            options=[
+                ("grpc.use_local_subchannel_pool", 1),
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+            ],
+        )
+        clients.append(
+            speech_v2.SpeechClient(
+                transport=SpeechGrpcTransport(host=host, channel=channel)
+            )
+        )
+    return clients
+
+
+def _delete_phrase_set_and_wait(client: speech_v2.SpeechClient, name: str) -> None:
+    """Deletes one PhraseSet and blocks until its operation completes."""
+    operation = client.delete_phrase_set(name=name)
+    operation.result(timeout=120.0, polling=POLLING_POLICY)
+
+
+def delete_phrase_sets(
+    project_id: str,
+    phrase_set_ids: list[str],
+    pool_size: int = 4,
+    location: str = "global",
+) -> None:
+    """Deletes several PhraseSets in parallel over a pool of connections.
+
+    A single client is enough for scripts that delete one PhraseSet at a
+    time. A pool only pays off for bulk workloads, such as cleaning up
+    hundreds of PhraseSets after a test run, where many deletes and their
+    operation polls are in flight at once.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        phrase_set_ids: The IDs of the PhraseSets to delete.
+        pool_size: The number of connections to spread the requests over.
+        location: The location of the resources, such as "global" or
+            "us-central1".
+
+    Raises:
+        ValueError: If pool_size is less than 1.
+    """
+    if pool_size < 1:
+        raise ValueError(f"pool_size must be at least 1, got {pool_size}.")
+
+    clients = _make_pooled_speech_clients(pool_size, location)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=pool_size * 8) as pool:
+            # Hand the clients out in round-robin order, one per request.
+            futures = {
+                pool.submit(
+                    _delete_phrase_set_and_wait,
+                    client,
+                    f"projects/{project_id}/locations/{location}/phraseSets/{phrase_set_id}",
+                ): phrase_set_id
+                for client, phrase_set_id in zip(
+                    itertools.cycle(clients), phrase_set_ids
+                )
+            }
+            for future in concurrent.futures.as_completed(futures):
+                phrase_set_id = futures[future]
+                try:
+                    future.result()
+                except exceptions.NotFound:
+                    print(
+                        f"Phrase set '{phrase_set_id}' not found. It may have "
+                        "already been deleted or never existed.",
+                        file=sys.stderr,
+                    )
+                except concurrent.futures.TimeoutError:
+                    print(
+                        f"Timed out waiting for phrase set '{phrase_set_id}' to "
+                        "be deleted. The delete may still finish on the server.",
+                        file=sys.stderr,
+                    )
+                except exceptions.GoogleAPICallError as e:
+                    print(
+                        f"Error deleting phrase set '{phrase_set_id}': {e}",
+                        file=sys.stderr,
+                    )
+                else:
+                    print(f"Deleted phrase set: {phrase_set_id}")
+    finally:
+        for client in clients:
+            client.transport.close()
+
+
+# [END speech_v2_speech_phrasesets_delete_pooled]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Deletes several PhraseSets in parallel over a pool of "
+        "gRPC connections."
+    )
+    parser.add_argument(
+        "--project_id",
+        type=str,
+        required=True,
+        help="The Google Cloud project ID.",
+    )
+    parser.add_argument(
+        "--phrase_set_ids",
+        type=lambda value: value.split(","),
+        required=True,
+        help="A comma-separated list of PhraseSet IDs to delete (e.g., 'a,b,c').",
+    )
+    parser.add_argument(
+        "--pool_size",
+        type=int,
+        default=4,
+        help="The number of gRPC connections to use (4 to 8 is typical).",
+    )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
+
+    args = parser.parse_args()
+
+    delete_phrase_sets(
+        project_id=args.project_id,
+        phrase_set_ids=args.phrase_set_ids,
+        pool_size=args.pool_size,
+        location=args.location,
+    )
@@ -12,38 +12,86 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import argparse
 
 # [START speech_v2_speech_phrasesets_list]
+import atexit
+import concurrent.futures
+import functools
 import sys
+from typing import TYPE_CHECKING
+
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import GoogleAPICallError, NotFound
+
+if TYPE_CHECKING:
+    from google.cloud import speech_v2
+
+# The sample only prints each PhraseSet's name, so ask the service to return
+# just that field (and the token needed to fetch the next page) instead of
+# every field of every PhraseSet.
+FIELD_MASK_METADATA = [("x-goog-fieldmask", "phrase_sets.name,next_page_token")]
+
 
-from google.api_core.exceptions import NotFound
-from google.cloud import speech_v2
+@functools.cache
+def _get_speech_client(location: str = "global") -> speech_v2.SpeechClient:
+    """Returns the SpeechClient for a location, shared by every call in this process."""
+    # Import on first use so that --help does not load the client library.
+    from google.cloud import speech_v2
+
+    client_options = None
+    if location != "global":
+        client_options = ClientOptions(api_endpoint=f"{location}-speech.googleapis.com")
+    client = speech_v2.SpeechClient(client_options=client_options)
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def list_phrase_sets(
     project_id: str,
+    location: str = "global",
 ) -> None:
     """Lists existing PhraseSets in a given project.
 
     Args:
         project_id: The Google Cloud project ID.
+        location: The location of the resources, such as "global" or
+            "us-central1".
     """
+    from google.cloud import speech_v2
 
-    client = speech_v2.SpeechClient()
+    client = _get_speech_client(location)
 
-    parent = client.common_location_path(project=project_id, location="global")
+    parent = f"projects/{project_id}/locations/{location}"
 
     request = speech_v2.ListPhraseSetsRequest(parent=parent)
 
     try:
-        page_result = client.list_phrase_sets(request=request)
+        pages = iter(
+            client.list_phrase_sets(request=request, metadata=FIELD_MASK_METADATA).pages
+        )
 
         print(f"PhraseSets in {parent}:")
         found_phrase_sets = False
-        for phrase_set in page_result:
-            found_phrase_sets = True
-            print(f"  - {phrase_set.name}")
+        # Fetch each page on a background thread while the previous one is
+        # being written, so the next round trip overlaps the output work.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(next, pages, None)
+            while (page := next_page.result()) is not None:
+                next_page = prefetcher.submit(next, pages, None)
+                # Write each page with a single call instead of one print()
+                # per PhraseSet. The raw page yields the raw PhraseSets, so
+                # no proto-plus wrapper is built for each.
+                raw_page = speech_v2.ListPhraseSetsResponse.pb(page)
+                lines = [
+                    f"  - {phrase_set.name}\n" for phrase_set in raw_page.phrase_sets
+                ]
+                if lines:
+                    found_phrase_sets = True
+                    sys.stdout.write("".join(lines))
 
         if not found_phrase_sets:
             print("  No PhraseSets found.")
@@ -51,8 +99,8 @@ def list_phrase_sets(
     except NotFound as e:
         print(f"Error: The specified project was not found: {e}", file=sys.stderr)
         print("Please ensure that the project ID is correct.", file=sys.stderr)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
+    except GoogleAPICallError as e:
+        print(f"Error listing phrase sets: {e}", file=sys.stderr)
         print(
             "Please check your network connection or API permissions.", file=sys.stderr
         )
@@ -71,6 +119,13 @@ if __name__ == "__main__":
         required=True,
         help="Your Google Cloud project ID.",
     )
+    parser.add_argument(
+        "--location",
+        type=str,
+        default="global",
+        help="The location of the resources, such as 'global' or 'us-central1'. "
+        "Regional locations are sent to their regional endpoint.",
+    )
     args = parser.parse_args()
 
-    list_phrase_sets(args.project_id)
+    list_phrase_sets(args.project_id, args.location)
@@ -0,0 +1,127 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+# [START storage_v2_storagecontrol_folders_create_async]
+# [START storage_storagecontrol_folders_create_async]
+# [START storage_control_bulk_create_folders_async]
+import asyncio
+import functools
+from typing import TYPE_CHECKING
+
+import google.api_core.exceptions
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors with the same backoff as the synchronous samples:
+# starting at 1 second and capped at 30 seconds between attempts, for up to
+# 2 minutes.
+RETRY_POLICY = retry.AsyncRetry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+@functools.cache
+def _empty_folder() -> storage_control_v2.Folder:
+    """Returns the empty Folder that create requests require.
+
+    The message carries no fields and is never modified, so it is built on
+    first use and then reused rather than allocated for every create.
+    """
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    return storage_control_v2.Folder()
+
+
+async def _create_folder_async(
+    client: storage_control_v2.StorageControlAsyncClient,
+    parent: str,
+    folder_name: str,
+    semaphore: asyncio.Semaphore,
+) -> storage_control_v2.Folder:
+    """Creates one folder once a request slot is free."""
+    async with semaphore:
+        return await client.create_folder(
+            parent=parent,
+            folder=_empty_folder(),
+            folder_id=folder_name,
+            retry=RETRY_POLICY,
+        )
+
+
+async def bulk_create_folders(
+    bucket_name: str,
+    folder_names: list[str],
+    concurrency: int = 64,
+) -> None:
+    """Creates several folders in a hierarchical namespace (HNS) enabled bucket.
+
+    Creating them one at a time makes the total time the sum of every round
+    trip. Sharing one StorageControlAsyncClient and awaiting the creates
+    together keeps up to `concurrency` of them in flight on the same
+    multiplexed HTTP/2 connection.
+
+    Args:
+        bucket_name: The name of the bucket where the folders will be created.
+                     This bucket must have hierarchical namespace enabled.
+        folder_names: The full paths of the folders to create, each including
+                      a trailing slash (e.g., "my-folder/sub-folder/")
+        concurrency: The maximum number of creates in flight at once.
+    """
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlAsyncClient()
+
+    # The "_" denotes this bucket exists in the global namespace.
+    parent_path = f"projects/_/buckets/{bucket_name}"
+
+    semaphore = asyncio.Semaphore(concurrency)
+    try:
+        # return_exceptions=True keeps one failed create from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(
+                _create_folder_async(client, parent_path, folder_name, semaphore)
+                for folder_name in folder_names
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for folder_name, result in zip(folder_names, results):
+        if isinstance(result, google.api_core.exceptions.AlreadyExists):
+            print(
+                f"Error: Folder '{folder_name}' already exists in bucket "
+                f"'{bucket_name}'."
+            )
+        elif isinstance(result, google.api_core.exceptions.GoogleAPICallError):
+            print(f"An API error occurred creating folder '{folder_name}': {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Successfully created folder: {result.name}")
+
+
+# [END storage_control_bulk_create_folders_async]
+# [END storage_storagecontrol_folders_create_async]
+# [END storage_v2_storagecontrol_folders_create_async]
@@ -0,0 +1,125 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+# [START storage_v2_storagecontrol_folders_delete_async]
+# [START storage_storagecontrol_folders_delete_async]
+# [START storage_control_bulk_delete_folders_async]
+import asyncio
+from typing import TYPE_CHECKING
+
+import google.api_core.exceptions
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors with the same backoff as the synchronous samples:
+# starting at 1 second and capped at 30 seconds between attempts, for up to
+# 2 minutes.
+RETRY_POLICY = retry.AsyncRetry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+async def _delete_folder_async(
+    client: storage_control_v2.StorageControlAsyncClient,
+    name: str,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Deletes one folder once a request slot is free."""
+    async with semaphore:
+        await client.delete_folder(name=name, retry=RETRY_POLICY)
+
+
+async def bulk_delete_folders(
+    bucket_name: str,
+    folder_names: list[str],
+    concurrency: int = 64,
+) -> None:
+    """Deletes several folders in a hierarchical namespace-enabled bucket.
+
+    Deleting them one at a time makes the total time the sum of every round
+    trip. Sharing one StorageControlAsyncClient and awaiting the deletes
+    together keeps up to `concurrency` of them in flight on the same
+    multiplexed HTTP/2 connection.
+
+    A folder must be empty before it can be deleted, so the folders are
+    deleted one level of nesting at a time, deepest first. Every folder at
+    one level is deleted concurrently, and the next level up starts only
+    once they have all finished.
+
+    Args:
+        bucket_name: The name of the bucket containing the folders.
+        folder_names: The full paths of the folders to delete, each including
+                      a trailing slash (e.g., "my-folder/sub-folder/"). They
+                      may be given in any order.
+        concurrency: The maximum number of deletes in flight at once.
+    """
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlAsyncClient()
+
+    # Group the folders by depth, which is the number of "/" in the path.
+    levels = {}
+    for folder_name in folder_names:
+        levels.setdefault(folder_name.count("/"), []).append(folder_name)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results = {}
+    try:
+        for depth in sorted(levels, reverse=True):
+            level = levels[depth]
+            # return_exceptions=True keeps one failed delete from cancelling
+            # the rest.
+            level_results = await asyncio.gather(
+                *(
+                    _delete_folder_async(
+                        client,
+                        f"projects/_/buckets/{bucket_name}/folders/{folder_name}",
+                        semaphore,
+                    )
+                    for folder_name in level
+                ),
+                return_exceptions=True,
+            )
+            results.update(zip(level, level_results))
+    finally:
+        await client.transport.close()
+
+    for folder_name, result in results.items():
+        if isinstance(result, google.api_core.exceptions.NotFound):
+            print(f"Error: Folder '{folder_name}' not found.")
+        elif isinstance(result, google.api_core.exceptions.FailedPrecondition):
+            print(
+                f"Error deleting folder '{folder_name}': {result}. "
+                "Folders must be empty before they can be deleted."
+            )
+        elif isinstance(result, google.api_core.exceptions.GoogleAPICallError):
+            print(f"An API error occurred deleting folder '{folder_name}': {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"Successfully deleted folder: {folder_name}")
+
+
+# [END storage_control_bulk_delete_folders_async]
+# [END storage_storagecontrol_folders_delete_async]
+# [END storage_v2_storagecontrol_folders_delete_async]
@@ -0,0 +1,108 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+# [START storage_v2_storagecontrol_folders_scan_async]
+# [START storage_storagecontrol_folders_scan_async]
+# [START storage_control_scan_folders_async]
+import asyncio
+import sys
+from typing import TYPE_CHECKING
+
+import google.api_core.exceptions
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+
+async def _list_bucket_folders_async(
+    client: storage_control_v2.StorageControlAsyncClient,
+    bucket_name: str,
+    semaphore: asyncio.Semaphore,
+) -> list[storage_control_v2.Folder]:
+    """Lists every folder in one bucket once a request slot is free."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    request = storage_control_v2.ListFoldersRequest(
+        parent=f"projects/_/buckets/{bucket_name}",
+        page_size=1000,
+    )
+    async with semaphore:
+        pager = await client.list_folders(request=request)
+        return [folder async for folder in pager]
+
+
+async def scan_folders(
+    bucket_names: list[str],
+    concurrency: int = 16,
+) -> None:
+    """Lists the folders of several hierarchical namespace enabled buckets.
+
+    Listing the buckets one after another makes the total time the sum of
+    every bucket's listing. Sharing one StorageControlAsyncClient and
+    awaiting the listings together overlaps them, so the total is close to
+    that of the largest bucket.
+
+    Each listed folder already carries its full metadata, so the scan needs
+    no follow-up get_folder calls.
+
+    Args:
+        bucket_names: The names of the buckets to list folders from.
+        concurrency: The maximum number of buckets listed at once.
+    """
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlAsyncClient()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    try:
+        # return_exceptions=True keeps one failed listing from cancelling the
+        # rest.
+        results = await asyncio.gather(
+            *(
+                _list_bucket_folders_async(client, bucket_name, semaphore)
+                for bucket_name in bucket_names
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await client.transport.close()
+
+    for bucket_name, result in zip(bucket_names, results):
+        if isinstance(result, google.api_core.exceptions.NotFound):
+            print(
+                f"Error: The bucket '{bucket_name}' was not found or does not "
+                "have a hierarchical namespace enabled."
+            )
+        elif isinstance(result, google.api_core.exceptions.GoogleAPICallError):
+            print(f"An API error occurred listing bucket '{bucket_name}': {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            # Write each bucket's folders with a single call.
+            sys.stdout.write(
+                f"Folders in bucket '{bucket_name}': {len(result)}\n"
+                + "".join(
+                    f"  {folder.name} (Metageneration: {folder.metageneration}, "
+                    f"Update Time: {folder.update_time.isoformat()})\n"
+                    for folder in result
+                )
+            )
+
+
+# [END storage_control_scan_folders_async]
+# [END storage_storagecontrol_folders_scan_async]
+# [END storage_v2_storagecontrol_folders_scan_async]
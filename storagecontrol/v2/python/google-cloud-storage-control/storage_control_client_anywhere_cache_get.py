@@ -12,11 +12,94 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_anywherecache_get]
 # [START storage_storagecontrol_anywherecache_get]
 # [START storage_control_get_anywhere_cache]
+import atexit
+import concurrent.futures
+import functools
+import itertools
+import os
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# The number of gRPC connections that concurrent requests are spread over.
+# Set the GCS_GRPC_POOL environment variable to raise it for high-throughput
+# workloads.
+POOL_SIZE = int(os.environ.get("GCS_GRPC_POOL", "4"))
+if POOL_SIZE < 1:
+    raise ValueError(f"GCS_GRPC_POOL must be at least 1, got {POOL_SIZE}.")
+
+# The maximum number of get requests in flight at once.
+MAX_BULK_WORKERS = 32
+
+# Retry transient errors (such as 429 and 503) with exponential backoff and
+# jitter, starting at 1 second and capped at 30 seconds between attempts, for
+# up to 2 minutes. Reads are safe to repeat, so every transient error is retried.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+@functools.cache
+def _get_client(index: int = 0) -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process.
+
+    Each index gets its own client. By default gRPC shares one connection
+    between channels created with the same arguments, so each channel is
+    given a local subchannel pool to make it open its own connection.
+    """
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+    from google.cloud.storage_control_v2.services.storage_control.transports import (
+        StorageControlGrpcTransport,
+    )
+
+    # Passing options replaces the transport's defaults, so the unlimited
+    # message sizes of the default channel are set here as well.
+    channel = StorageControlGrpcTransport.create_channel(
+        options=[
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ]
+    )
+    client = storage_control_v2.StorageControlClient(
+        transport=StorageControlGrpcTransport(channel=channel)
+    )
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+def _get_pooled_clients() -> list[storage_control_v2.StorageControlClient]:
+    """Returns POOL_SIZE clients, each with its own gRPC connection.
+
+    Handing these out in turn spreads concurrent requests over several HTTP/2
+    connections instead of queueing them behind one connection's stream and
+    flow-control limits.
+    """
+    return [_get_client(index) for index in range(POOL_SIZE)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _anywhere_cache_path(bucket_name: str, anywhere_cache_zone: str) -> str:
+    """Returns the resource name of an Anywhere Cache.
+
+    The "_" denotes that the bucket exists in the global namespace.
+    """
+    return f"projects/_/buckets/{bucket_name}/anywhereCaches/{anywhere_cache_zone}"
 
 
 def get_anywhere_cache(
@@ -30,16 +113,14 @@ def get_anywhere_cache(
         anywhere_cache_zone: The ID zone of the Anywhere Cache instance to retrieve.
                            Example: "us-central1-a"
     """
-    client = storage_control_v2.StorageControlClient()
+    client = _get_client()
 
-    anywhere_cache_name = client.anywhere_cache_path(
-        project="_",
-        bucket=bucket_name,
-        anywhere_cache=anywhere_cache_zone,
-    )
+    anywhere_cache_name = _anywhere_cache_path(bucket_name, anywhere_cache_zone)
 
     try:
-        anywhere_cache = client.get_anywhere_cache(name=anywhere_cache_name)
+        anywhere_cache = client.get_anywhere_cache(
+            name=anywhere_cache_name, retry=RETRY_POLICY
+        )
 
         print(f"Successfully retrieved Anywhere Cache: {anywhere_cache.name}")
         print(f"  Zone: {anywhere_cache.zone}")
@@ -59,6 +140,51 @@ def get_anywhere_cache(
         print(f"An unexpected error occurred: {e}")
 
 
+def get_anywhere_caches_bulk(
+    bucket_name: str,
+    anywhere_cache_zones: list[str],
+) -> list[storage_control_v2.AnywhereCache]:
+    """Retrieves the metadata for several Anywhere Cache instances concurrently.
+
+    The gets run on a thread pool, with the pooled clients handed out in turn,
+    so their round trips overlap instead of adding up.
+
+    Args:
+        bucket_name: The name of the bucket where the Anywhere Caches are located.
+        anywhere_cache_zones: The zones of the Anywhere Cache instances to
+                              retrieve. Example: ["us-central1-a", "us-east1-b"]
+
+    Returns:
+        The Anywhere Caches that were found, in the order of anywhere_cache_zones.
+    """
+    clients = _get_pooled_clients()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_BULK_WORKERS) as pool:
+        futures = [
+            pool.submit(
+                client.get_anywhere_cache,
+                name=_anywhere_cache_path(bucket_name, zone),
+                retry=RETRY_POLICY,
+            )
+            for client, zone in zip(itertools.cycle(clients), anywhere_cache_zones)
+        ]
+
+    anywhere_caches = []
+    for zone, future in zip(anywhere_cache_zones, futures):
+        try:
+            anywhere_cache = future.result()
+        except google.api_core.exceptions.NotFound:
+            print(
+                f"Error: Anywhere Cache '{zone}' not found in bucket '{bucket_name}'."
+            )
+        except google.api_core.exceptions.GoogleAPICallError as e:
+            print(f"An API error occurred retrieving Anywhere Cache '{zone}': {e}")
+        else:
+            anywhere_caches.append(anywhere_cache)
+            print(f"Successfully retrieved Anywhere Cache: {anywhere_cache.name}")
+    return anywhere_caches
+
+
 # [END storage_control_get_anywhere_cache]
 # [END storage_storagecontrol_anywherecache_get]
 # [END storage_v2_storagecontrol_anywherecache_get]
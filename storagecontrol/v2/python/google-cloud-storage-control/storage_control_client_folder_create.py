@@ -12,11 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_folder_create]
 # [START storage_storagecontrol_folder_create]
 # [START storage_control_create_folder]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors (such as 429 and 503) with exponential backoff and
+# jitter, starting at 1 second and capped at 30 seconds between attempts, for
+# up to 2 minutes. The client fills in a request_id for each call and reuses it
+# on every attempt, so the service treats a retry as the same request.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.cache
+def _empty_folder() -> storage_control_v2.Folder:
+    """Returns the empty Folder that create requests require.
+
+    The message carries no fields and is never modified, so it is built on
+    first use and then reused rather than allocated for every create.
+    """
+    from google.cloud import storage_control_v2
+
+    return storage_control_v2.Folder()
 
 
 def create_folder(
@@ -31,20 +76,19 @@ def create_folder(
         folder_name: The full path of the folder to create,
                      including trailing slash (e.g., "my-folder/sub-folder/")
     """
-    client = storage_control_v2.StorageControlClient()
+    client = _get_client()
 
     # The "_" denotes this bucket exists in the global namespace.
     GLOBAL_NAMESPACE_PATTERN = "_"
     parent_path = f"projects/{GLOBAL_NAMESPACE_PATTERN}/buckets/{bucket_name}"
 
-    # Create an empty Folder object as required by the API
-    folder_resource = storage_control_v2.Folder()
-
     try:
         folder = client.create_folder(
             parent=parent_path,
-            folder=folder_resource,
+            # The API requires a Folder object, which can be empty.
+            folder=_empty_folder(),
             folder_id=folder_name,
+            retry=RETRY_POLICY,
         )
 
         print(f"Successfully created folder: {folder.name}")
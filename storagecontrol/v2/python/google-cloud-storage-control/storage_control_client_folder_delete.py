@@ -12,11 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_folder_delete]
 # [START storage_storagecontrol_folder_delete]
 # [START storage_control_delete_folder]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors (such as 429 and 503) with exponential backoff and
+# jitter, starting at 1 second and capped at 30 seconds between attempts, for
+# up to 2 minutes. The client fills in a request_id for each call and reuses it
+# on every attempt, so the service treats a retry as the same request.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _folder_path(bucket_name: str, folder_name: str) -> str:
+    """Returns the resource name of a folder.
+
+    The "_" denotes that the bucket exists in the global namespace.
+    """
+    return f"projects/_/buckets/{bucket_name}/folders/{folder_name}"
 
 
 def delete_folder(
@@ -30,17 +72,13 @@ def delete_folder(
         folder_name: The full path of the folder to delete,
                      including trailing slash (e.g., "my-folder/sub-folder/")
     """
-    client = storage_control_v2.StorageControlClient()
+    client = _get_client()
 
-    # The "_" denotes this bucket exists in the global namespace.
-    GLOBAL_NAMESPACE_PATTERN = "_"
-    folder_path = client.folder_path(
-        project=GLOBAL_NAMESPACE_PATTERN, bucket=bucket_name, folder=folder_name
-    )
+    folder_path = _folder_path(bucket_name, folder_name)
 
     try:
         print(f"Attempting to delete folder: {folder_name}")
-        client.delete_folder(name=folder_path)
+        client.delete_folder(name=folder_path, retry=RETRY_POLICY)
 
         print(f"Successfully deleted folder: {folder_name}")
     except google.api_core.exceptions.NotFound:
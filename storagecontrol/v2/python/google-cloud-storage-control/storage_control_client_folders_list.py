@@ -12,11 +12,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_folders_list]
 # [START storage_storagecontrol_folders_list]
 # [START storage_control_list_folders]
+import atexit
+import concurrent.futures
+import functools
+import sys
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors (such as 429 and 503) with exponential backoff and
+# jitter, starting at 1 second and capped at 30 seconds between attempts, for
+# up to 2 minutes. Reads are safe to repeat, so every transient error is retried.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+# Let each list response stream start with an 8 MiB HTTP/2 flow-control window
+# instead of gRPC's 64 KiB default, so a 1000-item page is not throttled by
+# round trips for window updates over high-latency links. gRPC's bandwidth-
+# delay probing then grows the connection window as needed. Passing options
+# replaces the transport's defaults, so the unlimited message sizes of the
+# default channel are set here as well.
+CHANNEL_OPTIONS = [
+    ("grpc.http2.lookahead_bytes", 8 << 20),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+    from google.cloud.storage_control_v2.services.storage_control.transports import (
+        StorageControlGrpcTransport,
+    )
+
+    channel = StorageControlGrpcTransport.create_channel(options=CHANNEL_OPTIONS)
+    client = storage_control_v2.StorageControlClient(
+        transport=StorageControlGrpcTransport(channel=channel)
+    )
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def list_folders(
@@ -25,30 +78,53 @@ def list_folders(
     """
     Lists folders within a hierarchical namespace enabled bucket.
 
+    Each listed folder already carries its full metadata (metageneration and
+    create and update times). Prefer listing over calling get_folder for each
+    folder when enumerating, which would cost one extra round trip per folder.
+
     Args:
         bucket_name: The name of the bucket to list folders from.
     """
-    client = storage_control_v2.StorageControlClient()
+    from google.cloud import storage_control_v2
+
+    client = _get_client()
 
     GLOBAL_NAMESPACE_PATTERN = "_"
     parent_path = f"projects/{GLOBAL_NAMESPACE_PATTERN}/buckets/{bucket_name}"
 
     try:
+        # Request the largest page the service allows (1000), so a bucket
+        # with thousands of folders needs as few round trips as possible.
+        # The cost is a slightly longer wait for the first page.
         request = storage_control_v2.ListFoldersRequest(
             parent=parent_path,
+            page_size=1000,
         )
 
-        page_result = client.list_folders(request=request)
+        pages = iter(client.list_folders(request=request, retry=RETRY_POLICY).pages)
 
         print(f"Folders in bucket '{bucket_name}':")
         found_folders = False
-        for folder in page_result:
-            found_folders = True
-            print(f"Folder Name: {folder.name}")
-            print(f"Metageneration: {folder.metageneration}")
-            print(f"Create Time: {folder.create_time}")
-            print(f"Update Time: {folder.update_time}")
-            print("---")
+        # Fetch each page on a background thread while the previous one is
+        # being printed, so the next round trip overlaps the output work.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(next, pages, None)
+            while (page := next_page.result()) is not None:
+                next_page = prefetcher.submit(next, pages, None)
+                # Write each page with a single call instead of five print()
+                # calls per folder. The metadata printed here is the same that
+                # get_folder returns, so no follow-up gets are needed.
+                lines = [
+                    f"Folder Name: {folder.name}\n"
+                    f"Metageneration: {folder.metageneration}\n"
+                    f"Create Time: {folder.create_time.isoformat()}\n"
+                    f"Update Time: {folder.update_time.isoformat()}\n"
+                    "---\n"
+                    for folder in page.folders
+                ]
+                if lines:
+                    found_folders = True
+                    sys.stdout.write("".join(lines))
 
         if not found_folders:
             print(f"No folders found in bucket '{bucket_name}'.")
@@ -13,11 +13,44 @@
 # limitations under the License.
 
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_managedfolder_create]
 # [START storage_storagecontrol_managedfolder_create]
 # [START storage_control_managed_folder_create]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors (such as 429 and 503) with exponential backoff and
+# jitter, starting at 1 second and capped at 30 seconds between attempts, for
+# up to 2 minutes. The client fills in a request_id for each call and reuses it
+# on every attempt, so the service treats a retry as the same request.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def create_managed_folder(
@@ -31,7 +64,9 @@ def create_managed_folder(
         bucket_name: The name of the bucket where the managed folder will be created.
         managed_folder_name: The ID of the managed folder to create.
     """
-    client = storage_control_v2.StorageControlClient()
+    from google.cloud import storage_control_v2
+
+    client = _get_client()
 
     GLOBAL_NAMESPACE_PATTERN = "_"
     parent_name = f"projects/{GLOBAL_NAMESPACE_PATTERN}/buckets/{bucket_name}"
@@ -42,7 +77,9 @@ def create_managed_folder(
             managed_folder_id=managed_folder_name,
         )
 
-        managed_folder = client.create_managed_folder(request=request)
+        managed_folder = client.create_managed_folder(
+            request=request, retry=RETRY_POLICY
+        )
 
         print(f"Successfully created managed folder: {managed_folder.name}")
         print(f"Metageneration: {managed_folder.metageneration}")
@@ -12,11 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_managedfolder_delete]
 # [START storage_storagecontrol_managedfolder_delete]
 # [START storage_control_managed_folder_delete]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+from google.api_core import retry
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+# Retry transient errors (such as 429 and 503) with exponential backoff and
+# jitter, starting at 1 second and capped at 30 seconds between attempts, for
+# up to 2 minutes. The client fills in a request_id for each call and reuses it
+# on every attempt, so the service treats a retry as the same request.
+RETRY_POLICY = retry.Retry(
+    predicate=retry.if_transient_error,
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _managed_folder_path(bucket_name: str, managed_folder_name: str) -> str:
+    """Returns the resource name of a managed folder.
+
+    The "_" denotes that the bucket exists in the global namespace.
+    """
+    return f"projects/_/buckets/{bucket_name}/managedFolders/{managed_folder_name}"
 
 
 def delete_managed_folder(bucket_name: str, managed_folder_name: str) -> None:
@@ -27,22 +69,18 @@ def delete_managed_folder(bucket_name: str, managed_folder_name: str) -> None:
         bucket_name: The name of the bucket containing the managed folder.
         managed_folder_name: The full path of the managed folder to delete.
     """
-    client = storage_control_v2.StorageControlClient()
+    from google.cloud import storage_control_v2
 
-    GLOBAL_NAMESPACE_PATTERN = "_"
+    client = _get_client()
 
-    managed_folder_path = client.managed_folder_path(
-        project=GLOBAL_NAMESPACE_PATTERN,
-        bucket=bucket_name,
-        managed_folder=managed_folder_name,
-    )
+    managed_folder_path = _managed_folder_path(bucket_name, managed_folder_name)
 
     request = storage_control_v2.DeleteManagedFolderRequest(
         name=managed_folder_path,
     )
 
     try:
-        client.delete_managed_folder(request=request)
+        client.delete_managed_folder(request=request, retry=RETRY_POLICY)
         print(f"Managed folder '{managed_folder_path}' deleted successfully.")
     except google.api_core.exceptions.NotFound:
         print(f"Error: Managed folder '{managed_folder_path}' not found.")
@@ -12,11 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_managedfolder_get]
 # [START storage_storagecontrol_managedfolder_get]
 # [START storage_control_managed_folder_get]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _managed_folder_path(bucket_name: str, managed_folder_name: str) -> str:
+    """Returns the resource name of a managed folder.
+
+    The "_" denotes that the bucket exists in the global namespace.
+    """
+    return f"projects/_/buckets/{bucket_name}/managedFolders/{managed_folder_name}"
 
 
 def get_managed_folder(bucket_name: str, managed_folder_name: str) -> None:
@@ -27,17 +56,9 @@ def get_managed_folder(bucket_name: str, managed_folder_name: str) -> None:
         managed_folder_name: The full path of the managed folder to retrieve,
                              including trailing slash (e.g., "my-folder/sub-folder/")
     """
-    client = storage_control_v2.StorageControlClient()
-
-    # The storage bucket path uses the global access pattern,
-    # in which the "_" denotes this bucket exists in the global namespace.
-    GLOBAL_NAMESPACE_PATTERN = "_"
+    client = _get_client()
 
-    managed_folder_path = client.managed_folder_path(
-        project=GLOBAL_NAMESPACE_PATTERN,
-        bucket=bucket_name,
-        managed_folder=managed_folder_name,
-    )
+    managed_folder_path = _managed_folder_path(bucket_name, managed_folder_name)
 
     try:
         managed_folder = client.get_managed_folder(name=managed_folder_path)
@@ -12,13 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_projectintelligenceconfig_update]
 # [START storage_storagecontrol_projectintelligenceconfig_update]
 # [START storage_control_projectintelligenceconfig_update]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
 from google.protobuf import field_mask_pb2
 
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
+
 
 def update_project_intelligence_config(
     project_id: str,
@@ -29,7 +49,9 @@ def update_project_intelligence_config(
     Args:
         project_id: The ID of the Google Cloud project.
     """
-    client = storage_control_v2.StorageControlClient()
+    from google.cloud import storage_control_v2
+
+    client = _get_client()
 
     name = f"projects/{project_id}/locations/global/intelligenceConfig"
 
@@ -12,11 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 # [START storage_v2_storagecontrol_storagelayout_get]
 # [START storage_storagecontrol_storagelayout_get]
 # [START storage_control_quickstart_sample]
+import atexit
+import functools
+from typing import TYPE_CHECKING
+
 import google.api_core.exceptions
-from google.cloud import storage_control_v2
+
+if TYPE_CHECKING:
+    from google.cloud import storage_control_v2
+
+
+@functools.cache
+def _get_client() -> storage_control_v2.StorageControlClient:
+    """Returns a StorageControlClient that is reused for every call in this process."""
+    # Import on first use so that importing this module stays cheap.
+    from google.cloud import storage_control_v2
+
+    client = storage_control_v2.StorageControlClient()
+    # Close the channel cleanly when the interpreter exits.
+    atexit.register(client.transport.close)
+    return client
 
 
 def get_storage_layout(bucket_name: str) -> None:
@@ -26,7 +46,9 @@ def get_storage_layout(bucket_name: str) -> None:
     Args:
         bucket_name: The name of the bucket to retrieve the storage layout for.
     """
-    client = storage_control_v2.StorageControlClient()
+    from google.cloud import storage_control_v2
+
+    client = _get_client()
 
     GLOBAL_NAMESPACE_PATTERN = "_"
     storage_layout_name = client.storage_layout_path(